@@ -2,27 +2,59 @@
 """UNL Events Search — FastAPI microservice with periodic re-scraping."""
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import os
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import asdict
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from fastapi import FastAPI, Query
+from dataclasses import asdict, fields as dataclass_fields
+from functools import partial
+from datetime import date, datetime, time, timezone
+from itertools import islice
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
-from scraper import cross_dedupe, enrich_events, scrape_engage, scrape_rss
+try:
+    import brotli
+except ImportError:  # /events is served gzip-only
+    brotli = None
+
+from cache import LRUCache
+from changes import ChangeLog
+from eventstore import EventStore, atomic_write, is_store, write_store
+from index import DateIndex, Snapshot
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, Counter, Histogram
+from semantic import available as semantic_available
+from scraper import (
+    DEFAULT_BASE_URL,
+    ENGAGE_API,
+    Event,
+    cross_dedupe,
+    dedupe_events,
+    enrich_events,
+    enrich_events_concurrent,
+    iter_enrich_incremental,
+    iter_scrape_rss,
+    scrape_engage,
+)
 from search import (
+    LOCAL_EXPANSION,
+    RANKINGS,
+    SEARCH_MODES,
     STOP_WORDS,
     base_terms,
-    expand_with_gemini,
-    extract_date_range,
-    filter_by_date,
-    filter_by_time,
-    load_events,
-    search,
+    expand_with_gemini_async,
+    expansion_cache,
+    extract_when,
+    warm_llm,
 )
 
 logging.basicConfig(
@@ -32,59 +64,279 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
-EVENTS_FILE = os.environ.get("EVENTS_FILE", "scraped/events.json")
+# "json" (events.json payload) or "columnar" (eventstore file). Either format
+# is read back at startup, whatever EVENTS_FILE is called.
+EVENTS_FORMAT = os.environ.get("EVENTS_FORMAT", "json")
+EVENTS_FILE = os.environ.get(
+    "EVENTS_FILE", "scraped/events.col" if EVENTS_FORMAT == "columnar" else "scraped/events.json"
+)
 DEFAULT_MODEL = os.environ.get("GEMINI_MODEL", "gemma-3-27b-it")
 SCRAPE_INTERVAL = int(os.environ.get("SCRAPE_INTERVAL", "3600"))
 SCRAPE_WORKERS = int(os.environ.get("SCRAPE_WORKERS", "10"))
-
-_events: List[Dict[str, Any]] = []
+SCRAPE_BASE_URL = os.environ.get("SCRAPE_BASE_URL", DEFAULT_BASE_URL)
+ENGAGE_API_URL = os.environ.get("ENGAGE_API_URL", ENGAGE_API)
+# "threads" (ThreadPoolExecutor, SCRAPE_WORKERS) or "async" (asyncio engine,
+# SCRAPE_CONCURRENCY in flight per host at SCRAPE_RATE requests/second).
+SCRAPE_ENRICH_MODE = os.environ.get("SCRAPE_ENRICH_MODE", "threads")
+SCRAPE_CONCURRENCY = int(os.environ.get("SCRAPE_CONCURRENCY", "64"))
+SCRAPE_RATE = float(os.environ.get("SCRAPE_RATE", "50"))
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", "512"))
+# "index" (trigram TermIndex) or "matrix" (NumPy sparse term-document matrices,
+# for large snapshots). Results are identical either way.
+SEARCH_BACKEND = os.environ.get("SEARCH_BACKEND", "index")
+# Build LSA vectors with every snapshot for /search?mode=semantic (needs numpy).
+SEMANTIC_SEARCH = os.environ.get("SEMANTIC_SEARCH", "1") == "1" and semantic_available()
+_INDEX_OPTIONS = {"backend": SEARCH_BACKEND, "semantic": SEMANTIC_SEARCH, "expansions": LOCAL_EXPANSION}
+# Serialized /events bodies per (snapshot, page, projection); cleared on every swap.
+EVENTS_BODY_CACHE_SIZE = int(os.environ.get("EVENTS_BODY_CACHE_SIZE", "64"))
+# Generations /events/changes can diff from; older ones get a resync response.
+CHANGES_HISTORY = int(os.environ.get("CHANGES_HISTORY", "48"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+EVENT_FIELDS = tuple(f.name for f in dataclass_fields(Event))
+# RSS items parsed, and detail pages enriched, between partial publishes.
+SCRAPE_BATCH_SIZE = int(os.environ.get("SCRAPE_BATCH_SIZE", "250"))
+
+_snapshot = Snapshot.build([], generation=0, complete=False, **_INDEX_OPTIONS)
+# Scored results per (generation, term set, date/time window, top); cleared on every swap.
+_results = LRUCache(maxsize=RESULT_CACHE_SIZE)
+_bodies = LRUCache(maxsize=EVENTS_BODY_CACHE_SIZE)
+_changes = ChangeLog(history=CHANGES_HISTORY)
 _last_scraped: Optional[datetime] = None
+# True while serving the snapshot loaded from EVENTS_FILE at startup, until a
+# fresh scrape replaces it.
+_stale = False
 _scrape_running = False
+_enrich_stats: Dict[str, int] = {}
 
+_inflight: Dict[tuple, "asyncio.Future"] = {}
+_coalescing = {"executed": 0, "coalesced": 0}
 
-def _full_scrape() -> List[Dict[str, Any]]:
-    """Blocking full-pipeline scrape. Runs in a thread executor."""
-    print("Scraping UNL RSS …")
-    events = scrape_rss()
-    print(f"  RSS: {len(events)} events — enriching …")
-    events = enrich_events(events, workers=SCRAPE_WORKERS)
-    print("  Fetching Engage events …")
-    try:
-        engage = scrape_engage()
-        before = len(events)
-        events = cross_dedupe(events, engage)
-        print(f"  Engage: +{len(events) - before} new events")
-    except Exception as exc:
-        print(f"  Engage warning: {exc}")
-    return [asdict(e) for e in events]
+SEARCH_STAGE_SECONDS = Histogram(
+    "search_stage_seconds",
+    "Time per /search stage. filtering and scoring only run on result cache misses.",
+    ("stage",),
+)
+SEARCH_LLM_FAILURES = Counter(
+    "search_llm_expansion_failures_total", "LLM expansions that failed or returned no keywords."
+)
+SCRAPE_STAGE_SECONDS = Histogram(
+    "scrape_stage_seconds",
+    "Time per scrape stage, summed over its batches: rss (fetch and parse), enrich, engage, dedupe.",
+    ("stage",),
+)
+SCRAPE_ERRORS = Counter(
+    "scrape_errors_total", "Scrape stages that failed or were cut short.", ("stage",)
+)
 
 
-def _save_events(events_list: List[Dict[str, Any]]) -> None:
-    output_dir = os.path.dirname(EVENTS_FILE)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
+def _timed_steps(steps: Iterator, spent: Dict[str, float], stage: str) -> Iterator:
+    """Yield from ``steps``, adding the time spent producing each item to spent[stage]."""
+    while True:
+        start = perf_counter()
+        try:
+            item = next(steps)
+        except StopIteration:
+            return
+        finally:
+            spent[stage] += perf_counter() - start
+        yield item
+
+
+def _scrape_engage_timed() -> List[Event]:
+    try:
+        with SCRAPE_STAGE_SECONDS.time(stage="engage"):
+            return scrape_engage(api_url=ENGAGE_API_URL)
+    except Exception:
+        SCRAPE_ERRORS.inc(stage="engage")
+        raise
+
+
+def _scrape_pipeline(previous: List[Dict[str, Any]]) -> Iterator[List[Event]]:
+    """Blocking fetch → parse → enrich → dedupe pipeline, stepped from a thread executor.
+
+    Yields the full, deduplicated event list after every stage and batch:
+    each SCRAPE_BATCH_SIZE RSS items parsed off the wire, then each batch of
+    detail-page enrichments. Engage is fetched alongside and merged in once it
+    arrives. The last list yielded is the finished scrape. Detail pages are
+    only fetched for events that are new or changed since ``previous`` (the
+    currently served snapshot)."""
+    global _enrich_stats
+    if SCRAPE_ENRICH_MODE == "async":
+        enrich = partial(enrich_events_concurrent, concurrency=SCRAPE_CONCURRENCY, rate=SCRAPE_RATE)
+    else:
+        enrich = partial(enrich_events, workers=SCRAPE_WORKERS)
+
+    spent = {"rss": 0.0, "enrich": 0.0, "dedupe": 0.0}
+
+    def deduped(fn, *args) -> List[Event]:
+        start = perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            spent["dedupe"] += perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        engage_future = pool.submit(_scrape_engage_timed)
+
+        def merged(rss: List[Event]) -> List[Event]:
+            if engage_future.done() and engage_future.exception() is None:
+                return deduped(cross_dedupe, rss, engage_future.result())
+            return rss
+
+        print("Scraping UNL RSS …")
+        parsed: List[Event] = []
+        stream = _timed_steps(iter_scrape_rss(base_url=SCRAPE_BASE_URL), spent, "rss")
+        try:
+            while True:
+                batch = list(islice(stream, SCRAPE_BATCH_SIZE))
+                if not batch:
+                    break
+                parsed.extend(batch)
+                yield merged(deduped(dedupe_events, parsed))
+        except ET.ParseError as exc:
+            SCRAPE_ERRORS.inc(stage="rss")
+            print(f"  RSS warning: feed cut short after {len(parsed)} items: {exc}")
+        except Exception:
+            SCRAPE_ERRORS.inc(stage="rss")
+            raise
+        events = deduped(dedupe_events, parsed)
+
+        print(f"  RSS: {len(events)} events — enriching …")
+        steps = iter_enrich_incremental(events, previous, enrich, SCRAPE_BATCH_SIZE)
+        for _enrich_stats in _timed_steps(steps, spent, "enrich"):
+            yield merged(events)
+
+        print("  Fetching Engage events …")
+        try:
+            engage = engage_future.result()
+            before = len(events)
+            events = deduped(cross_dedupe, events, engage)
+            print(f"  Engage: +{len(events) - before} new events")
+        except Exception as exc:
+            print(f"  Engage warning: {exc}")
+        for stage, seconds in spent.items():
+            SCRAPE_STAGE_SECONDS.observe(seconds, stage=stage)
+        yield events
+
+
+def _save_events(events_list: List[Dict[str, Any]], generation: int) -> None:
+    """Atomically rewrite EVENTS_FILE in EVENTS_FORMAT.
+
+    The generation is saved too, so numbering (and /events/changes) carries on
+    across restarts."""
+    scraped_at = datetime.now(timezone.utc).isoformat()
+    if EVENTS_FORMAT == "columnar":
+        write_store(EVENTS_FILE, events_list, scraped_at, generation)
+        return
     payload = {
-        "scraped_at": datetime.now(timezone.utc).isoformat(),
+        "scraped_at": scraped_at,
+        "generation": generation,
         "count": len(events_list),
         "events": events_list,
     }
-    with open(EVENTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False)
+    atomic_write(EVENTS_FILE, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def _load_snapshot(generation: int) -> Tuple[Optional[Snapshot], Optional[datetime]]:
+    """Index the events last written by _save_events(), in either format.
+
+    Returns (None, None) if there is no usable file. The saved generation is
+    kept if there is one, else ``generation`` is used. A columnar file's
+    pre-parsed start times are used for the date index directly.
+    """
+    dates = None
+    try:
+        if is_store(EVENTS_FILE):
+            with EventStore(EVENTS_FILE) as store:
+                events, raw_scraped_at = store.events(), store.scraped_at
+                generation = store.generation or generation
+                dates = DateIndex.from_columns(store.start_days, store.start_times)
+        else:
+            with open(EVENTS_FILE, encoding="utf-8") as f:
+                payload = json.load(f)
+            if not isinstance(payload, dict) or not isinstance(payload.get("events"), list):
+                log.warning("Ignoring %s: no events list", EVENTS_FILE)
+                return None, None
+            events, raw_scraped_at = payload["events"], payload.get("scraped_at")
+            saved = payload.get("generation")
+            generation = saved if isinstance(saved, int) and saved > 0 else generation
+    except FileNotFoundError:
+        return None, None
+    except (OSError, ValueError) as exc:
+        log.warning("Could not read %s: %s", EVENTS_FILE, exc)
+        return None, None
+    if not events:
+        return None, None
+    try:
+        scraped_at = datetime.fromisoformat(raw_scraped_at or "")
+    except ValueError:
+        scraped_at = None
+    return Snapshot.build(events, generation, dates=dates, **_INDEX_OPTIONS), scraped_at
+
+
+async def _warm_start() -> None:
+    """Serve the last saved snapshot, marked stale, until the first scrape finishes."""
+    global _snapshot, _last_scraped, _stale
+    loop = asyncio.get_running_loop()
+    snap, scraped_at = await loop.run_in_executor(None, _load_snapshot, _snapshot.generation + 1)
+    if snap is None:
+        return
+    await loop.run_in_executor(None, _changes.record, snap.generation, snap.events)
+    _snapshot = snap
+    _last_scraped = scraped_at
+    _stale = True
+    log.info("Loaded %d events (generation %d) from %s (scraped %s); refreshing in background",
+             len(snap.events), snap.generation, EVENTS_FILE,
+             scraped_at.isoformat() if scraped_at else "unknown")
+
+
+async def _publish(events: List[Event], complete: bool) -> Snapshot:
+    """Index off the event loop, then swap events and indexes as one object so a
+    request never mixes two snapshots."""
+    global _snapshot
+    loop = asyncio.get_running_loop()
+    rows = await loop.run_in_executor(None, lambda: [asdict(e) for e in events])
+    # Partial batches get the term and date indexes only; LSA vectors and the
+    # related-terms table cost seconds each and wait for the complete publish.
+    options = _INDEX_OPTIONS if complete else {**_INDEX_OPTIONS, "semantic": False, "expansions": False}
+    snap = await loop.run_in_executor(
+        None, partial(Snapshot.build, rows, _snapshot.generation + 1, complete=complete, **options)
+    )
+    await loop.run_in_executor(None, _changes.record, snap.generation, rows)
+    _snapshot = snap
+    _results.clear()
+    _bodies.clear()
+    return snap
 
 
 async def _do_scrape() -> None:
-    global _events, _last_scraped, _scrape_running
+    global _last_scraped, _scrape_running, _stale
     if _scrape_running:
         return
     _scrape_running = True
     try:
-        loop = asyncio.get_event_loop()
-        new_events = await loop.run_in_executor(None, _full_scrape)
-        _events = new_events
+        loop = asyncio.get_running_loop()
+        stages = _scrape_pipeline(_snapshot.events)
+        events: List[Event] = []
+        while True:
+            step = await loop.run_in_executor(None, next, stages, None)
+            if step is None:
+                break
+            events = step
+            # Partial batches only replace an empty or partial snapshot, never
+            # a complete one from an earlier scrape.
+            if not _snapshot.complete and events:
+                snap = await _publish(events, complete=False)
+                print(f"  Published partial batch: {len(events)} events (generation {snap.generation})")
+        snap = await _publish(events, complete=True)
         _last_scraped = datetime.now(timezone.utc)
-        _save_events(new_events)
-        print(f"Cache updated: {len(_events)} events at {_last_scraped.isoformat()}")
+        _stale = False
+        _save_events(snap.events, snap.generation)
+        print(f"Cache updated: {len(snap.events)} events (generation {snap.generation}) "
+              f"at {_last_scraped.isoformat()}")
     except Exception as exc:
+        SCRAPE_ERRORS.inc(stage="scrape")
         log.exception("Scrape failed: %s", exc)
     finally:
         _scrape_running = False
@@ -98,10 +350,17 @@ async def _periodic_scrape() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Scrape immediately, then repeat every SCRAPE_INTERVAL seconds.
-    # /health returns 503 while _events is empty so Railway retries until ready.
+    # Serve the last saved snapshot (if any) straight away, then scrape
+    # immediately and repeat every SCRAPE_INTERVAL seconds.
+    # /health returns 503 until events are loaded so Railway retries until ready.
+    await _warm_start()
+    # The LLM cache and client take a while to build (google.genai alone is
+    # about a second to import); do it in a worker thread, without holding
+    # up /health, rather than on the loop during the first /search.
+    llm_warmup = asyncio.create_task(asyncio.to_thread(warm_llm))
     task = asyncio.create_task(_periodic_scrape())
     yield
+    llm_warmup.cancel()
     task.cancel()
     try:
         await task
@@ -117,30 +376,203 @@ app = FastAPI(
 )
 
 
+def _health_status(snap: Snapshot) -> str:
+    if not snap.events:
+        return "starting"
+    if _stale:
+        return "stale"
+    return "ok" if snap.complete else "partial"
+
+
 @app.get("/health")
 def health():
+    snap = _snapshot
+    events = snap.events
     payload = {
-        "status": "ok" if _events else "starting",
-        "events_loaded": len(_events),
+        "status": _health_status(snap),
+        "events_loaded": len(events),
+        "generation": snap.generation,
+        "complete": snap.complete,
+        "stale": _stale,
         "last_scraped": _last_scraped.isoformat() if _last_scraped else None,
         "scrape_running": _scrape_running,
         "scrape_interval_seconds": SCRAPE_INTERVAL,
     }
-    if not _events:
+    if not events:
         return JSONResponse(status_code=503, content=payload)
     return payload
 
 
+class EncodedBody:
+    """A response body serialized once, then compressed at most once per encoding."""
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag = '"' + hashlib.sha1(self.raw).hexdigest()[:24] + '"'
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        if encoding is None:
+            return self.raw
+        with self._lock:
+            body = self._encoded.get(encoding)
+            if body is None:
+                if encoding == "br":
+                    body = brotli.compress(self.raw, quality=BROTLI_QUALITY)
+                else:
+                    body = gzip.compress(self.raw, GZIP_LEVEL, mtime=0)
+                self._encoded[encoding] = body
+            return body
+
+
+def _pick_encoding(accept_encoding: str) -> Optional[str]:
+    """br if the client takes it and brotli is installed, else gzip, else identity."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip())
+    wildcard = "*" in accepted
+    if brotli is not None and ("br" in accepted or wildcard):
+        return "br"
+    if "gzip" in accepted or wildcard:
+        return "gzip"
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @app.get("/events")
-def get_events():
-    """Return all cached events in the standard events.json format."""
+def get_events(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Max events per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated event fields to include"),
+):
+    """Return cached events in the standard events.json format.
+
+    Bodies are serialized and compressed once per snapshot and served with an
+    ETag; a matching If-None-Match gets 304. ``limit``/``cursor`` page through
+    the snapshot (adding ``total`` and ``next_cursor``) and ``fields`` keeps
+    only the named event fields. A cursor names the generation it was issued
+    for; once a newer snapshot is published it gets 409 and the client starts
+    again from the first page.
+    """
+    projection: Optional[Tuple[str, ...]] = None
+    if fields:
+        projection = tuple(f.strip() for f in fields.split(",") if f.strip())
+        unknown = [f for f in projection if f not in EVENT_FIELDS]
+        if unknown or not projection:
+            return JSONResponse(status_code=400, content={
+                "error": f"Unknown event field(s): {', '.join(unknown) or fields!r}.",
+                "fields": list(EVENT_FIELDS),
+            })
+    offset = 0
+    if cursor is not None:
+        generation, _, position = cursor.partition(":")
+        if not generation.isdigit() or not position.isdigit():
+            return JSONResponse(status_code=400, content={"error": "Invalid cursor."})
+        offset = int(position)
+
+    snap = _snapshot
+    if cursor is not None and int(generation) != snap.generation:
+        return JSONResponse(status_code=409, content={
+            "error": "Events changed since this cursor was issued; restart without a cursor.",
+            "generation": snap.generation,
+        })
+    scraped_at = _last_scraped.isoformat() if _last_scraped else None
+    paged = limit is not None or cursor is not None
+    key = (snap.generation, scraped_at, projection, offset if paged else None, limit)
+    body = _bodies.get(key)
+    if body is None:
+        events = snap.events
+        if paged:
+            end = len(events) if limit is None else offset + limit
+            events = events[offset:end]
+        if projection is not None:
+            events = [{f: e.get(f) for f in projection} for e in events]
+        payload: Dict[str, Any] = {
+            "scraped_at": scraped_at,
+            "generation": snap.generation,
+            "count": len(events),
+            "events": events,
+        }
+        if paged:
+            end = offset + len(events)
+            payload["total"] = len(snap.events)
+            payload["next_cursor"] = f"{snap.generation}:{end}" if end < len(snap.events) else None
+        body = EncodedBody(payload)
+        _bodies.put(key, body)
+    return _send_body(request, body)
+
+
+@app.get("/events/changes")
+def get_event_changes(
+    request: Request,
+    since: int = Query(..., ge=0, description="Generation the client last synced to"),
+):
+    """Events added, updated and removed since generation ``since``.
+
+    ``removed`` lists event keys (URLs). When ``since`` is older than the
+    CHANGES_HISTORY generations kept, or unknown here, ``resync`` is true and
+    the client should refetch /events, whose body carries the generation.
+    """
+    snap = _snapshot
+    key = ("changes", snap.generation, since)
+    body = _bodies.get(key)
+    if body is None:
+        diff = _changes.diff(since, snap.generation, snap.events) if since <= snap.generation else None
+        payload: Dict[str, Any] = {"since": since, "generation": snap.generation, "resync": diff is None}
+        if diff is not None:
+            payload.update(diff)
+        body = EncodedBody(payload)
+        _bodies.put(key, body)
+    return _send_body(request, body)
+
+
+def _send_body(request: Request, body: EncodedBody) -> Response:
+    headers = {"ETag": body.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), body.etag):
+        return Response(status_code=304, headers=headers)
+    encoding = _pick_encoding(request.headers.get("accept-encoding", ""))
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body.encoded(encoding), media_type="application/json", headers=headers)
+
+
+@app.get("/stats")
+def stats():
+    """Cache, request-coalescing and enrichment counters."""
     return {
-        "scraped_at": _last_scraped.isoformat() if _last_scraped else None,
-        "count": len(_events),
-        "events": _events,
+        "llm_cache": expansion_cache().stats(),
+        "search_coalescing": {**_coalescing, "in_flight": len(_inflight)},
+        "result_cache": {**_results.stats(), "generation": _snapshot.generation, "backend": SEARCH_BACKEND},
+        "events_body_cache": _bodies.stats(),
+        "changes": _changes.stats(),
+        "last_enrichment": _enrich_stats,
     }
 
 
+@app.get("/metrics")
+def get_metrics():
+    """Per-stage latency histograms and error counters in the Prometheus text format."""
+    return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.post("/reload")
 async def reload_events():
     """Trigger an immediate re-scrape in the background."""
@@ -151,12 +583,31 @@ async def reload_events():
 
 
 @app.get("/search")
-def search_events(
+async def search_events(
     q: str = Query(..., description="Natural-language search query"),
     top: int = Query(10, ge=1, le=100, description="Max results to return"),
     model: str = Query(DEFAULT_MODEL, description="Ollama model for keyword expansion"),
     no_llm: bool = Query(False, description="Skip Ollama expansion"),
+    ranking: str = Query("weighted", pattern=f"^({'|'.join(RANKINGS)})$",
+                         description="weighted field hits, or bm25f"),
+    mode: str = Query("keyword", pattern=f"^({'|'.join(SEARCH_MODES)})$",
+                      description="keyword terms, or semantic (local vectors, no LLM)"),
 ):
+    # Single flight: identical concurrent requests share one expansion + scoring run.
+    key = (q, model, no_llm, top, ranking, mode)
+    task = _inflight.get(key)
+    if task is None:
+        _coalescing["executed"] += 1
+        task = asyncio.ensure_future(_search(q, top, model, no_llm, ranking, mode))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        _coalescing["coalesced"] += 1
+    # Shielded so one client disconnecting doesn't cancel the others' result.
+    return await asyncio.shield(task)
+
+
+async def _search(q: str, top: int, model: str, no_llm: bool, ranking: str, mode: str = "keyword"):
     base = base_terms(q)
     terms = list(base)
     llm_used = False
@@ -165,8 +616,9 @@ def search_events(
 
     llm_date_range = None
     llm_time_range = None
-    if not no_llm:
-        llm_keywords, llm_date_range, llm_time_range = expand_with_gemini(q, model)
+    if not no_llm and mode == "keyword":
+        with SEARCH_STAGE_SECONDS.time(stage="llm_expansion"):
+            llm_keywords, llm_date_range, llm_time_range = await expand_with_gemini_async(q, model)
         if llm_keywords:
             llm_keywords = [k for k in llm_keywords if k not in STOP_WORDS and len(k) > 1]
             seen = set(terms)
@@ -183,67 +635,89 @@ def search_events(
             if llm_time_range:
                 log.info("  LLM time_range %s → %s", llm_time_range[0], llm_time_range[1])
         else:
+            SEARCH_LLM_FAILURES.inc()
             log.warning("  LLM expansion failed or returned no keywords — using base terms only")
 
     log.info("  final_terms=%s", terms)
 
-    date_range = llm_date_range or extract_date_range(q)
-    time_range = llm_time_range
+    # Date parsing and scoring are CPU work; keep them off the event loop.
+    return await run_in_threadpool(
+        _run_search, q, terms, llm_used, llm_date_range, llm_time_range, top, ranking, mode
+    )
+
+
+def _run_search(
+    q: str,
+    terms: List[str],
+    llm_used: bool,
+    llm_date_range: Optional[Tuple[date, date]],
+    llm_time_range: Optional[Tuple[Optional[time], Optional[time]]],
+    top: int,
+    ranking: str = "weighted",
+    mode: str = "keyword",
+):
+    date_range, time_range = llm_date_range, llm_time_range
+    if date_range is None or time_range is None:
+        with SEARCH_STAGE_SECONDS.time(stage="date_resolution"):
+            local_dates, local_times = extract_when(q)
+        date_range = date_range or local_dates
+        time_range = time_range or local_times
 
     if not terms and not date_range and not time_range:
         return JSONResponse(status_code=400, content={"error": "No usable search terms in query."})
 
-    pool = _events
-    if date_range:
-        pool = filter_by_date(pool, date_range, time_range)
-    elif time_range:
-        pool = filter_by_time(pool, time_range)
-
-    log.info("  date_filter=%s  time_filter=%s  pool=%d events",
-             f"{date_range[0]} → {date_range[1]}" if date_range else "none",
-             f"{time_range[0]} → {time_range[1]}" if time_range else "none",
-             len(pool))
-
-    # If no keyword terms, return entire filtered pool (pure date/time query)
-    if not terms:
-        log.info("  no terms — returning full filtered pool (%d events)", len(pool))
-        result_events = pool[:top]
-        return {
-            "query": q,
-            "terms": [],
-            "llm_used": llm_used,
-            "date_range": (
-                {"start": str(date_range[0]), "end": str(date_range[1])}
-                if date_range else None
-            ),
-            "time_range": (
-                {"start": str(time_range[0]) if time_range[0] else None,
-                 "end":   str(time_range[1]) if time_range[1] else None}
-                if time_range else None
-            ),
-            "total_searched": len(pool),
-            "count": len(result_events),
-            "results": [
-                {
-                    "score": 0,
-                    "url": e["url"],
-                    "title": e["title"],
-                    "start": e.get("start"),
-                    "location": e.get("location"),
-                    "group": e.get("group"),
-                    "image_url": e.get("image_url"),
-                }
-                for e in result_events
-            ],
-        }
-
-    results = search(pool, terms, top)
+    snap = _snapshot
+    if mode == "semantic" and snap.semantic is None:
+        error = "Semantic search is not enabled." if not SEMANTIC_SEARCH else "Semantic search is not ready yet."
+        return JSONResponse(status_code=503, content={"error": error})
+    local_added: List[str] = []
+    if not llm_used and mode == "keyword":
+        with SEARCH_STAGE_SECONDS.time(stage="local_expansion"):
+            local_added = snap.local_expansion(terms)
+        if local_added:
+            log.info("  local expansion  added=%s", local_added)
+            terms = terms + local_added
+    # Sorted, not a set: scoring counts a repeated term each time.
+    key = (snap.generation, tuple(sorted(terms)), date_range, time_range, top, ranking, mode)
+    cached = _results.get(key)
+    if cached is None:
+        with SEARCH_STAGE_SECONDS.time(stage="filtering"):
+            ids = snap.dates.filter(date_range, time_range) if date_range or time_range else None
+            pool = snap.events if ids is None else [snap.events[i] for i in ids]
+
+        log.info("  date_filter=%s  time_filter=%s  pool=%d events",
+                 f"{date_range[0]} → {date_range[1]}" if date_range else "none",
+                 f"{time_range[0]} → {time_range[1]}" if time_range else "none",
+                 len(pool))
+
+        # If no keyword terms, return entire filtered pool (pure date/time query)
+        if not terms:
+            log.info("  no terms — returning full filtered pool (%d events)", len(pool))
+            results = [(0, e) for e in pool[:top]]
+        else:
+            with SEARCH_STAGE_SECONDS.time(stage="scoring"):
+                if mode == "semantic":
+                    results = snap.semantic.search(terms, top, ids)
+                else:
+                    results = snap.terms.search(terms, top, ids, ranking=ranking)
+        cached = (len(pool), results)
+        _results.put(key, cached)
+    else:
+        log.info("  result cache hit (generation %d)", snap.generation)
+
+    total_searched, results = cached
     log.info("  results=%d", len(results))
 
-    return {
+    # Encoded here, in the worker thread, so serialization is timed and stays
+    # off the event loop.
+    start = perf_counter()
+    payload = {
         "query": q,
         "terms": terms,
         "llm_used": llm_used,
+        "local_expansion": local_added,
+        "ranking": ranking,
+        "mode": mode,
         "date_range": (
             {"start": str(date_range[0]), "end": str(date_range[1])}
             if date_range else None
@@ -253,11 +727,11 @@ def search_events(
              "end":   str(time_range[1]) if time_range[1] else None}
             if time_range else None
         ),
-        "total_searched": len(pool),
+        "total_searched": total_searched,
         "count": len(results),
         "results": [
             {
-                "score": score,
+                "score": round(score, 4),
                 "url": e["url"],
                 "title": e["title"],
                 "start": e.get("start"),
@@ -268,3 +742,6 @@ def search_events(
             for score, e in results
         ],
     }
+    response = JSONResponse(content=payload)
+    SEARCH_STAGE_SECONDS.observe(perf_counter() - start, stage="serialization")
+    return response
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark: sequential vs. concurrent Engage paging, and description-to-text conversion.
+
+Run from api/:  python bench/bench_engage.py [--items 2000] [--latency 0.1]
+
+Pages come from a local FakeEventsServer that adds ``latency`` to every
+response. concurrency=1 is the old one-page-at-a-time loop, so its wall time
+is about pages × RTT; concurrent runs should approach first page + one RTT.
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from fakeserver import FakeEventsServer, engage_item  # noqa: E402
+from scraper import ENGAGE_PAGE_SIZE, html_text, scrape_engage  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds added to each response")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 32])
+    args = parser.parse_args()
+
+    pages = -(-args.items // ENGAGE_PAGE_SIZE)
+    print(f"{args.items} events, {pages} pages, {args.latency * 1000:.0f} ms per response")
+    print(f"{'concurrency':>11} {'s':>7} {'RTTs':>6} {'requests':>9}")
+    baseline = None
+    with FakeEventsServer(latency=args.latency, engage_items=args.items) as server:
+        for concurrency in args.concurrency:
+            server.reset_counters()
+            t0 = time.perf_counter()
+            events = scrape_engage(api_url=server.engage_url, concurrency=concurrency)
+            secs = time.perf_counter() - t0
+            print(f"{concurrency:11d} {secs:7.2f} {secs / args.latency:6.1f} {server.requests:9d}")
+            rows = [asdict(e) for e in events]
+            if baseline is None:
+                baseline = rows
+            elif rows != baseline:
+                print(f"concurrency={concurrency} returned different events", file=sys.stderr)
+                return 1
+
+    descriptions = [engage_item(i)["description"] for i in range(args.items)]
+    t0 = time.perf_counter()
+    soup_text = [BeautifulSoup(d, "html.parser").get_text() for d in descriptions]
+    soup_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    plain_text = [html_text(d) for d in descriptions]
+    plain_s = time.perf_counter() - t0
+    print(f"descriptions: BeautifulSoup {soup_s * 1e6 / args.items:.0f} us/item, "
+          f"html_text {plain_s * 1e6 / args.items:.0f} us/item ({soup_s / plain_s:.1f}x)")
+    return 0 if soup_text == plain_text else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark: thread-pool vs. asyncio detail-page enrichment against the local fake server.
+
+Run from api/:  python bench/bench_enrich.py [--sizes 1000 10000 50000] [--latency S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import scraper  # noqa: E402
+from fakeserver import FakeEventsServer  # noqa: E402
+from scraper import Event, enrich_events, enrich_events_concurrent  # noqa: E402
+
+
+def run(server, urls, engine):
+    events = [Event(title=f"event {i}", url=url) for i, url in enumerate(urls)]
+    server.reset_counters()
+    t0 = time.perf_counter()
+    engine(events)
+    elapsed = time.perf_counter() - t0
+    ok = sum(1 for e in events if e.image_url and e.group and e.audience)
+    return elapsed, server.connections, server.requests, ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--latency", type=float, default=0.05, help="per-request server delay (s)")
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rate", type=float, default=0, help="async per-host req/s, 0 = unlimited")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--small-pages", action="store_true",
+                        help="serve ~3 KB pages so fetching, not parsing, dominates")
+    args = parser.parse_args()
+
+    engines = {
+        f"threads({args.workers})": lambda evs: enrich_events(evs, workers=args.workers),
+        f"async({args.concurrency})": lambda evs: enrich_events_concurrent(
+            evs, concurrency=args.concurrency, rate=args.rate, retries=3
+        ),
+    }
+    print(f"latency {args.latency * 1000:.0f} ms, fail rate {args.fail_rate:.0%}, "
+          f"{'small' if args.small_pages else 'full-size'} pages")
+    print(f"{'events':>7} {'engine':<12} {'wall s':>8} {'ev/s':>8} {'conns':>7} {'reqs':>7} {'enriched':>9}")
+    with FakeEventsServer(
+        latency=args.latency, fail_rate=args.fail_rate, chrome=not args.small_pages
+    ) as server:
+        for size in args.sizes:
+            urls = server.detail_urls(size)
+            for name, engine in engines.items():
+                scraper._session, scraper._session_pool_size = None, 0
+                stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+                try:
+                    elapsed, conns, reqs, ok = run(server, urls, engine)
+                finally:
+                    sys.stdout.close()
+                    sys.stdout = stdout
+                print(f"{size:>7} {name:<12} {elapsed:8.2f} {size / elapsed:8.0f} {conns:>7} {reqs:>7} {ok:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark: local expansion table vs. base terms vs. the Gemini expansion path.
+
+Run from api/:  python bench/bench_expansion.py [--events ../scraped/events.json] [--top 10] [-v]
+
+Uses bench_semantic's query set and reference: the LLM path's terms
+(Gemini with GEMINI_API_KEY set, else the hand-written stand-in table),
+scored by TermIndex. For each way of building the term list it reports
+the cost of expanding, overlap with the LLM path's top k, and over the
+full matched sets the share of the LLM path's matches found (recall)
+and the share of its own matches the LLM path agrees with (precision).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bench_semantic import DEFAULT_EVENTS, QUERIES, expanded_terms, urls  # noqa: E402
+from expansion import ExpansionTable  # noqa: E402
+from index import TermIndex  # noqa: E402
+from search import base_terms, load_events  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", default=DEFAULT_EVENTS)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("-v", "--verbose", action="store_true", help="print each query's added terms")
+    args = parser.parse_args()
+
+    events = load_events(args.events)
+    index = TermIndex(events)
+    tables = {}
+    for name, kwargs in (("seeds", {"cooccurrence": False}), ("corpus", {"seeds": ()}), ("seeds+corpus", {})):
+        t0 = time.perf_counter()
+        tables[name] = ExpansionTable(events, **kwargs)
+        print(f"{name:<13} table: {len(tables[name]):5d} terms, built in {time.perf_counter() - t0:.2f} s")
+
+    variants = {"base": None, **tables}
+    totals = {name: [] for name in variants}
+    for query in QUERIES:
+        base = base_terms(query)
+        llm, _ = expanded_terms(query)
+        llm_top = urls(index.search(llm, args.top))
+        llm_all = urls(index.search(llm, len(events)))
+        for name, table in variants.items():
+            t0 = time.perf_counter()
+            added = table.expand(base) if table is not None else []
+            expand_us = (time.perf_counter() - t0) * 1e6
+            terms = base + added
+            top = urls(index.search(terms, args.top))
+            matched = urls(index.search(terms, len(events)))
+            totals[name].append((
+                expand_us,
+                len(top & llm_top) / len(llm_top) if llm_top else None,
+                len(matched & llm_all) / len(llm_all) if llm_all else None,
+                len(matched & llm_all) / len(matched) if matched else None,
+            ))
+            if args.verbose and table is not None:
+                print(f"  {name:<13} {query!r}: {added}")
+
+    def mean(values):
+        values = [v for v in values if v is not None]
+        return sum(values) / len(values) if values else float("nan")
+
+    print(f"\n{len(QUERIES)} queries, top {args.top}, against the LLM path")
+    print(f"{'terms':<13} {'expand us':>9} {'top-k overlap':>13} {'recall':>7} {'precision':>9}")
+    for name, rows in totals.items():
+        cols = [mean(r[i] for r in rows) for i in range(4)]
+        print(f"{name:<13} {cols[0]:9.1f} {cols[1]:13.2f} {cols[2]:7.2f} {cols[3]:9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Benchmark: detail-page enrichment with one connection per request vs. the pooled session.
+
+Run from api/:  python bench/bench_http.py [--events N] [--workers N] [--latency S] [--connect-latency S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import requests  # noqa: E402
+
+import scraper  # noqa: E402
+from fakeserver import FakeEventsServer  # noqa: E402
+from scraper import Event, enrich_events  # noqa: E402
+
+
+def run(server, urls, workers, pooled):
+    events = [Event(title=f"event {i}", url=url) for i, url in enumerate(urls)]
+    original = scraper.http_session
+    if not pooled:
+        # What fetch_html() did before: module-level requests.get, a fresh connection each call.
+        scraper.http_session = lambda *a, **k: requests
+    else:
+        scraper._session, scraper._session_pool_size = None, 0
+    server.reset_counters()
+    t0 = time.perf_counter()
+    try:
+        enriched = enrich_events(events, workers=workers)
+    finally:
+        scraper.http_session = original
+    elapsed = time.perf_counter() - t0
+    ok = sum(1 for e in enriched if e.image_url and e.group and e.audience)
+    return elapsed, server.connections, server.requests, ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.005, help="per-request server delay (s)")
+    parser.add_argument("--connect-latency", type=float, default=0.03,
+                        help="per-connection setup delay standing in for TCP+TLS (s)")
+    args = parser.parse_args()
+
+    with FakeEventsServer(latency=args.latency, connect_latency=args.connect_latency) as server:
+        urls = server.detail_urls(args.events)
+        print(f"{args.events} detail pages, {args.workers} workers, "
+              f"latency {args.latency * 1000:.0f} ms, connect {args.connect_latency * 1000:.0f} ms")
+        print(f"{'mode':<10} {'wall s':>8} {'conns':>7} {'reqs':>6} {'enriched':>9}")
+        for label, pooled in (("per-call", False), ("pooled", True)):
+            print(f"{label:<10} {{:8.2f}} {{:7d}} {{:6d}} {{:9d}}".format(*run(server, urls, args.workers, pooled)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
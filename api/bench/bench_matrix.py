@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark: linear scan vs. TermIndex vs. MatrixIndex on synthetic corpora.
+
+Run from api/:  python bench/bench_matrix.py [--sizes 10000 100000 500000] [--queries 50]
+
+Events are generated from a Zipf-distributed vocabulary of made-up words,
+so posting lengths look like real text at any corpus size. Queries mix
+whole words with word fragments (terms are substrings, not tokens).
+search.search() and TermIndex are skipped above --scan-max / --index-max
+events: the scan is minutes per query set and the trigram index needs
+several GB by 500k events. Wherever TermIndex runs, MatrixIndex results
+are checked against it for both rankings.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from index import TermIndex  # noqa: E402
+from matrix import MatrixIndex  # noqa: E402
+from search import search  # noqa: E402
+
+SYLLABLES = ["ka", "lo", "mi", "ter", "san", "dru", "vel", "on", "is", "gra", "pe", "lun", "ho", "bri", "za", "ut"]
+AUDIENCES = ["Undergraduate Students", "Graduate Students", "Faculty", "Staff", "Alumni", "Public"]
+
+
+def make_vocab(size, rng):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words, key=lambda _: rng.random())
+
+
+def make_events(n, vocab, rng):
+    cum = []
+    total = 0.0
+    for rank in range(1, len(vocab) + 1):
+        total += 1 / rank
+        cum.append(total)
+
+    def words(k):
+        return " ".join(rng.choices(vocab, cum_weights=cum, k=k))
+
+    return [
+        {
+            "title": words(rng.randint(3, 8)).title(),
+            "url": f"https://example.edu/event/{i}",
+            "start": None,
+            "end": None,
+            "location": words(rng.randint(1, 3)).title(),
+            "description": words(rng.randint(15, 60)),
+            "group": words(rng.randint(1, 4)).title(),
+            "image_url": None,
+            "audience": rng.sample(AUDIENCES, rng.randint(0, 2)) or None,
+            "source": "rss",
+        }
+        for i in range(n)
+    ]
+
+
+def make_queries(count, vocab, rng):
+    head = vocab[:2000]
+    queries = []
+    for _ in range(count):
+        terms = [rng.choice(head) for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.3:
+            word = rng.choice(head)
+            terms.append(word[:max(2, len(word) - 2)])
+        queries.append(terms)
+    return queries
+
+
+def build(cls, events):
+    t0 = time.perf_counter()
+    index = cls(events)
+    return index, time.perf_counter() - t0
+
+
+def per_query(fn, queries, warm=True):
+    """Mean ms per query. A warm-up pass first fills per-generation memos
+    (MatrixIndex's term → vocabulary matches, both indexes' BM25 df)."""
+    if warm:
+        for terms in queries:
+            fn(terms)
+    t0 = time.perf_counter()
+    results = [fn(terms) for terms in queries]
+    return (time.perf_counter() - t0) * 1000 / len(queries), results
+
+
+def keyed(results):
+    return [[(score, event["url"]) for score, event in r] for r in results]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--vocab", type=int, default=30000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--scan-max", type=int, default=100000)
+    parser.add_argument("--index-max", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocab(args.vocab, rng)
+    queries = make_queries(args.queries, vocab, rng)
+    skipped = "       -"
+    print(f"{len(vocab)} words, {len(queries)} queries, top {args.top}; build s, ms per query")
+    print(f"{'events':>7} {'index build':>11} {'matrix build':>12} {'scan':>8} "
+          f"{'index':>8} {'matrix':>8} {'idx bm25':>8} {'mx bm25':>8}")
+    for size in args.sizes:
+        events = make_events(size, vocab, rng)
+        matrix, m_build = build(MatrixIndex, events)
+        m_ms, m_res = per_query(lambda t: matrix.search(t, args.top), queries)
+        mb_ms, mb_res = per_query(lambda t: matrix.search(t, args.top, ranking="bm25f"), queries)
+
+        scan = skipped
+        if size <= args.scan_max:
+            s_ms, _ = per_query(lambda t: search(events, t, args.top), queries[:10], warm=False)
+            scan = f"{s_ms:8.2f}"
+        index_build, index_q, index_bm = f"{skipped:>11}", skipped, skipped
+        if size <= args.index_max:
+            terms, t_build = build(TermIndex, events)
+            t_ms, t_res = per_query(lambda t: terms.search(t, args.top), queries)
+            tb_ms, tb_res = per_query(lambda t: terms.search(t, args.top, ranking="bm25f"), queries)
+            if keyed(t_res) != keyed(m_res) or keyed(tb_res) != keyed(mb_res):
+                print(f"{size}: MatrixIndex and TermIndex results differ", file=sys.stderr)
+                return 1
+            index_build = f"{t_build:11.2f}"
+            index_q, index_bm = f"{t_ms:8.2f}", f"{tb_ms:8.2f}"
+            del terms, t_res, tb_res
+        print(f"{size:7d} {index_build} {m_build:12.2f} {scan} "
+              f"{index_q} {m_ms:8.2f} {index_bm} {mb_ms:8.2f}")
+        del matrix, events
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
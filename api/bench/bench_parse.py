@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark: full BeautifulSoup parse vs. the selective scan used by apply_detail_page().
+
+Run from api/:  python bench/bench_parse.py [--fixtures DIR] [--pages N]
+
+With --fixtures, every *.html file in DIR (e.g. saved events.unl.edu detail
+pages) is used; otherwise N synthetic pages come from fakeserver.detail_page().
+The EDGE_CASES pages, with fields hidden in comments and scripts, are always
+checked too; any scan result that differs from the full parse fails the run.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fakeserver import detail_page  # noqa: E402
+from scraper import parse_detail_page, scan_detail_page  # noqa: E402
+
+_PAGE = detail_page(0)
+_AUDIENCE_DIV = '<div class="unl-event-audience">'
+_LD_JSON = '<script type="application/ld+json">'
+# Markup the full parse never sees as tags, placed ahead of the real fields.
+EDGE_CASES = {
+    "commented-out audience link": _PAGE.replace(
+        _AUDIENCE_DIV, '<!-- <a href="//events.unl.edu/audience/?audience=Old">Old</a> -->' + _AUDIENCE_DIV
+    ),
+    "audience link in a JS string": _PAGE.replace(
+        "</head>", "<script>var s = '<a href=\"/audience/?audience=JS\">JS</a>';</script></head>"
+    ),
+    "commented-out ld+json": _PAGE.replace(
+        _LD_JSON, '<!-- <script type="application/ld+json">{"@type": "Event", "image": "//old.jpg"}</script> -->'
+        + _LD_JSON
+    ),
+}
+
+
+def load_fixtures(directory):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append(f.read())
+    return pages
+
+
+def timed(fn, pages, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [fn(p) for p in pages]
+        best = min(best, time.perf_counter() - t0)
+    return best, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", help="directory of saved detail pages (*.html)")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.fixtures) if args.fixtures else [detail_page(i) for i in range(args.pages)]
+    if not pages:
+        print("no fixtures found", file=sys.stderr)
+        return 1
+    mb = sum(len(p.encode("utf-8")) for p in pages) / 1e6
+
+    full_s, full = timed(parse_detail_page, pages, args.repeat)
+    scan_s, scanned = timed(scan_detail_page, pages, args.repeat)
+    fallbacks = sum(1 for r in scanned if r is None)
+    mismatches = sum(1 for f, r in zip(full, scanned) if r is not None and r != f)
+
+    print(f"{len(pages)} pages, {mb:.1f} MB, best of {args.repeat}")
+    print(f"{'path':<6} {'total ms':>9} {'ms/page':>8} {'pages/s':>8} {'MB/s':>7}")
+    for name, secs in (("full", full_s), ("scan", scan_s)):
+        print(f"{name:<6} {secs * 1000:9.1f} {secs * 1000 / len(pages):8.2f} "
+              f"{len(pages) / secs:8.0f} {mb / secs:7.1f}")
+    print(f"speedup {full_s / scan_s:.1f}x, {fallbacks} fallbacks to full parse, {mismatches} mismatches")
+
+    for name, page in EDGE_CASES.items():
+        full_fields, scanned_fields = parse_detail_page(page), scan_detail_page(page)
+        if scanned_fields is not None and scanned_fields != full_fields:
+            print(f"{name}: scan {scanned_fields} != full {full_fields}", file=sys.stderr)
+            mismatches += 1
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
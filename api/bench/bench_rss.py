@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark: whole-document RSS parse (ET tree + BeautifulSoup per item) vs. streaming.
+
+Run from api/:  python bench/bench_rss.py [--sizes 1700 10000 100000]
+
+Both paths fetch the feed from a local FakeEventsServer. Time is measured on
+its own run; peak traced memory on a second run under tracemalloc. The
+streaming path only counts the events it yields, as a pipeline stage
+consuming them one at a time would.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from fakeserver import FakeEventsServer  # noqa: E402
+from scraper import (  # noqa: E402
+    USER_AGENT,
+    Event,
+    clean_text,
+    extract_group_from_description,
+    http_session,
+    iter_scrape_rss,
+)
+
+
+def tree_parse(xml_text, source_url):
+    """parse_rss_events() as it was before streaming, minus dedupe."""
+    root = ET.fromstring(xml_text)
+    events = []
+    for item in root.find("channel").findall("item"):
+        title = clean_text(item.findtext("title"))
+        if not title:
+            continue
+        desc = item.findtext("description") or ""
+        soup = BeautifulSoup(desc, "html.parser")
+        start_el = soup.find("abbr", class_="dtstart")
+        end_el = soup.find("abbr", class_="dtend")
+        start = clean_text(start_el.get("title")) if start_el else None
+        end = clean_text(end_el.get("title")) if end_el else None
+        smalls = soup.find_all("small")
+        location = clean_text(smalls[2].get_text()) if len(smalls) >= 3 else None
+        for small in smalls:
+            small.decompose()
+        text = soup.get_text()
+        events.append(Event(
+            title=title,
+            url=item.findtext("link") or source_url,
+            start=start,
+            end=end,
+            location=location,
+            description=clean_text(text),
+            group=extract_group_from_description(text),
+            source=source_url,
+        ))
+    return events
+
+
+def run_tree(base_url):
+    url = base_url + "upcoming/?format=rss&limit=-1"
+    response = http_session().get(url, headers={"User-Agent": USER_AGENT}, timeout=300)
+    response.raise_for_status()
+    return len(tree_parse(response.text, url))
+
+
+def run_stream(base_url):
+    return sum(1 for _ in iter_scrape_rss(timeout=300, base_url=base_url))
+
+
+def measure(fn, base_url):
+    t0 = time.perf_counter()
+    count = fn(base_url)
+    secs = time.perf_counter() - t0
+    tracemalloc.start()
+    fn(base_url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, secs, peak / 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1700, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'items':>7} {'path':<7} {'s':>7} {'us/item':>8} {'peak MB':>8}")
+    for size in args.sizes:
+        with FakeEventsServer(rss_items=size) as server:
+            # Warm the server's feed cache so both paths see the same response time.
+            http_session().get(server.base_url + "upcoming/?format=rss&limit=-1", timeout=300).content
+            for name, fn in (("tree", run_tree), ("stream", run_stream)):
+                count, secs, peak = measure(fn, server.base_url)
+                if count != size:
+                    print(f"{name}: expected {size} events, got {count}", file=sys.stderr)
+                    return 1
+                print(f"{size:7d} {name:<7} {secs:7.2f} {secs * 1e6 / size:8.1f} {peak:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark: literal terms vs. local semantic search vs. the Gemini expansion path.
+
+Run from api/:  python bench/bench_semantic.py [--events ../scraped/events.json] [--top 10]
+
+The reference is the LLM path: base terms plus expansion keywords,
+scored by TermIndex. With GEMINI_API_KEY set, the expansion comes from
+expand_with_gemini() (uncached, so its latency is the real round trip).
+Without a key, the hand-written expansions below stand in for it and the
+LLM latency column is left empty. An empty index (the cold-start
+snapshot) is checked to return no results first. Per mode:
+
+    recall   share of the LLM path's top k that the mode's top k also holds
+    beyond   results in the mode's top k that the LLM path matches but the
+             query's own words do not, i.e. recall the literal path can't reach
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ["LLM_CACHE_FILE"] = ""
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from index import TermIndex  # noqa: E402
+from search import DEFAULT_MODEL, GEMINI_API_KEY, STOP_WORDS, base_terms, expand_with_gemini, load_events  # noqa: E402
+from semantic import SemanticIndex  # noqa: E402
+
+DEFAULT_EVENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scraped", "events.json")
+
+# Query → keywords of the kind _expand_prompt() asks Gemini for.
+QUERIES = {
+    "music": ["concert", "band", "choir", "orchestra", "jazz", "recital", "symphony", "piano"],
+    "sports": ["game", "basketball", "volleyball", "football", "soccer", "athletics", "huskers", "tournament"],
+    "fitness": ["yoga", "workout", "exercise", "gym", "wellness", "running"],
+    "art": ["exhibit", "gallery", "painting", "museum", "sculpture", "artist"],
+    "jobs": ["career", "internship", "employer", "resume", "hiring", "interview"],
+    "food": ["lunch", "dinner", "pizza", "snacks", "breakfast", "meal", "cooking"],
+    "volunteering": ["volunteer", "service", "community", "donate", "outreach"],
+    "science talk": ["lecture", "seminar", "research", "colloquium", "physics", "biology", "chemistry"],
+    "theater": ["play", "musical", "performance", "stage", "drama", "acting"],
+    "mental health": ["wellness", "counseling", "stress", "mindfulness", "meditation"],
+    "coding": ["programming", "software", "computer", "hackathon", "python", "data"],
+    "movies": ["film", "screening", "cinema", "documentary"],
+    "kids activities": ["children", "family", "youth", "camp"],
+    "networking": ["professional", "alumni", "mixer", "connect"],
+    "writing": ["poetry", "reading", "author", "book", "literature"],
+    "study help": ["tutoring", "study", "exam", "academic", "workshop"],
+    "religion": ["faith", "worship", "prayer", "church", "bible"],
+    "dance": ["ballet", "dancing", "choreography", "salsa"],
+    "entrepreneurship": ["startup", "business", "venture", "pitch", "innovation"],
+    "nature": ["outdoor", "hike", "garden", "environment", "prairie", "sustainability"],
+}
+
+
+def expanded_terms(query):
+    """(terms, seconds) for the LLM path: base terms plus expansion keywords."""
+    terms = base_terms(query)
+    if GEMINI_API_KEY:
+        t0 = time.perf_counter()
+        keywords = expand_with_gemini(query, DEFAULT_MODEL)[0] or []
+        elapsed = time.perf_counter() - t0
+    else:
+        keywords, elapsed = QUERIES[query], None
+    keywords = [k for k in keywords if k not in STOP_WORDS and len(k) > 1]
+    return terms + [k for k in keywords if k not in terms], elapsed
+
+
+def urls(results):
+    return {e["url"] for _, e in results}
+
+
+def check_empty_snapshot(top):
+    """A cold start indexes no events; every query must come back empty rather than raise."""
+    empty = SemanticIndex([])
+    for query in QUERIES:
+        if empty.search(base_terms(query), top) or empty.search(base_terms(query), top, ids=[]):
+            raise AssertionError(f"empty SemanticIndex returned results for {query!r}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", default=DEFAULT_EVENTS)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    check_empty_snapshot(args.top)
+    events = load_events(args.events)
+    t0 = time.perf_counter()
+    terms_index = TermIndex(events)
+    t1 = time.perf_counter()
+    semantic = SemanticIndex(events)
+    t2 = time.perf_counter()
+    print(f"{len(events)} events; TermIndex {t1 - t0:.2f} s, SemanticIndex {t2 - t1:.2f} s to build")
+    print(f"expansions from {'Gemini ' + DEFAULT_MODEL if GEMINI_API_KEY else 'the hand-written table'}; "
+          f"latency in ms, top {args.top}")
+    print(f"{'query':<18} {'literal ms':>10} {'recall':>6} {'beyond':>6} "
+          f"{'semantic ms':>11} {'recall':>6} {'beyond':>6} {'llm ms':>8}")
+
+    totals = {"literal": [], "semantic": [], "llm": []}
+    fmt = lambda v, w, p=2: f"{v:{w}.{p}f}" if v is not None else f"{'-':>{w}}"  # noqa: E731
+    for query in QUERIES:
+        base = base_terms(query)
+        expanded, llm_s = expanded_terms(query)
+        matched = urls(terms_index.search(expanded, len(events)))
+        literal = urls(terms_index.search(base, len(events)))
+        reference = urls(terms_index.search(expanded, args.top))
+        row = {}
+        for mode, fn in (("literal", lambda: terms_index.search(base, args.top)),
+                         ("semantic", lambda: semantic.search(base, args.top))):
+            t0 = time.perf_counter()
+            for _ in range(args.repeat):
+                results = fn()
+            ms = (time.perf_counter() - t0) * 1000 / args.repeat
+            found = urls(results)
+            row[mode] = (ms, len(found & reference) / len(reference) if reference else None,
+                         len((found & matched) - literal))
+            totals[mode].append(row[mode])
+        if llm_s is not None:
+            totals["llm"].append((llm_s * 1000, None, None))
+        cells = " ".join(f"{fmt(ms, w)} {fmt(r, 6)} {b:6d}" for (ms, r, b), w in zip(row.values(), (10, 11)))
+        print(f"{query:<18} {cells} {fmt(llm_s * 1000 if llm_s is not None else None, 8, 0)}")
+
+    def mean(values):
+        values = [v for v in values if v is not None]
+        return sum(values) / len(values) if values else None
+
+    cells = " ".join(
+        f"{fmt(mean(t[0] for t in totals[mode]), w)} {fmt(mean(t[1] for t in totals[mode]), 6)} "
+        f"{fmt(mean(t[2] for t in totals[mode]), 6, 1)}"
+        for mode, w in (("literal", 10), ("semantic", 11))
+    )
+    print(f"{'mean':<18} {cells} {fmt(mean(t[0] for t in totals['llm']), 8, 0)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
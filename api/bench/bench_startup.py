@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Benchmark: import time, and process start to first /health 200 and first non-empty /search.
+
+Run from api/:  python bench/bench_startup.py [--latency 0.2] [--runs 3] [--check]
+
+Imports each entry module in a fresh interpreter and reports the median
+time and any LAZY_MODULES that got loaded. A fresh interpreter also runs
+the first expand_with_gemini_async() call (with a dummy key, so it fails
+fast) beside a 5 ms ticker, and reports the longest event loop stall, the
+cost of building the LLM cache and client that lazy imports moved to
+first use. Then starts ``uvicorn api:app``
+against a local FakeEventsServer (via SCRAPE_BASE_URL / ENGAGE_API_URL),
+once cold with no EVENTS_FILE and once warm from a saved snapshot, and
+polls until each milestone is reached.
+
+With --check the exit status is 1 if an import, the loop stall or the
+warm /health goes over its budget (IMPORT_BUDGET_MS, LOOP_STALL_BUDGET_MS,
+WARM_HEALTH_BUDGET_S), if an import loads one of LAZY_MODULES, or if a
+warm server's result cache serves the query with its terms repeated
+the scores of the plain query, so a regression fails CI.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+
+import requests
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, API_DIR)
+
+from fakeserver import FakeEventsServer, rss_feed  # noqa: E402
+from scraper import parse_rss_events  # noqa: E402
+
+# Loaded only on the code paths that use them: Gemini expansion, scraping
+# and page parsing, async enrichment, the dateparser fallback.
+LAZY_MODULES = ("google.genai", "requests", "bs4", "aiohttp", "dateparser")
+# Medians on a 1-CPU container, with headroom over what the lazy imports
+# measure (~60 ms, ~650 ms for api) but well under the ~1.2 s google.genai adds.
+IMPORT_BUDGET_MS = {"search": 200, "scraper": 200, "api": 1200}
+WARM_HEALTH_BUDGET_S = 5.0
+# ~50 ms with the cache and client built in worker threads; ~1.1 s when
+# google.genai is imported on the loop.
+LOOP_STALL_BUDGET_MS = 250
+
+STALL_CODE = """
+import asyncio, sys, time
+import search
+
+async def main():
+    gaps = []
+    async def ticker():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.05)
+    await search.expand_with_gemini_async("jazz tonight", search.DEFAULT_MODEL)
+    tick.cancel()
+    print(max(gaps))
+
+asyncio.run(main())
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def write_snapshot(path, base_url, count):
+    events = [asdict(e) for e in parse_rss_events(rss_feed(base_url, count), base_url)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"scraped_at": "2026-01-01T00:00:00+00:00", "count": len(events), "events": events}, f)
+
+
+def import_time(module):
+    """(ms, lazy modules loaded) for importing ``module`` in a fresh interpreter."""
+    code = (
+        "import sys, time; t = time.perf_counter(); import {m}; "
+        "print(time.perf_counter() - t); print(' '.join(n for n in {lazy!r} if n in sys.modules))"
+    ).format(m=module, lazy=LAZY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=API_DIR, check=True)
+    seconds, loaded = out.stdout.split("\n")[:2]
+    return float(seconds) * 1000, loaded.split()
+
+
+def first_llm_stall(tmp):
+    """Longest event loop stall (ms) around the first expand_with_gemini_async() in a fresh interpreter."""
+    env = {**os.environ, "GEMINI_API_KEY": "bench-dummy-key", "LLM_CACHE_FILE": os.path.join(tmp, "llm.db")}
+    out = subprocess.run([sys.executable, "-c", STALL_CODE], capture_output=True, text=True,
+                         cwd=API_DIR, env=env, check=True)
+    return float(out.stdout.strip().splitlines()[-1]) * 1000
+
+
+def repeated_terms_probe(base, query):
+    """A failure message if "<query> <query>" is answered from "<query>"'s cache slot.
+
+    Scoring counts a repeated term each time, so the doubled query must score
+    differently; a result cache keyed on the term set would return the same."""
+    scores = [
+        [r["score"] for r in requests.get(base + "/search", params={"q": q, "no_llm": "true"}, timeout=5)
+         .json()["results"]]
+        for q in (query, f"{query} {query}")
+    ]
+    if scores[0] == scores[1]:
+        return f"{query!r} and {query + ' ' + query!r} returned the same scores {scores[0]}"
+    return None
+
+
+def time_to_ready(env, query, deadline, probe=None):
+    """Seconds from spawning the server to /health 200 and to a /search with results,
+    plus ``probe(base_url, query)`` run once the search succeeds."""
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app", "--port", str(port), "--log-level", "warning"],
+        cwd=API_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    health = search = probed = None
+    try:
+        while search is None and time.perf_counter() - t0 < deadline:
+            try:
+                if health is None and requests.get(base + "/health", timeout=5).status_code == 200:
+                    health = time.perf_counter() - t0
+                if health is not None:
+                    r = requests.get(base + "/search", params={"q": query, "no_llm": "true"}, timeout=5)
+                    if r.status_code == 200 and r.json().get("results"):
+                        search = time.perf_counter() - t0
+            except requests.ConnectionError:
+                pass
+            time.sleep(0.01)
+        if search is not None and probe is not None:
+            probed = probe(base, query)
+    finally:
+        proc.terminate()
+        proc.wait()
+    return health, search, probed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1700)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds added to each response")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--query", default="jazz concert")
+    parser.add_argument("--deadline", type=float, default=120.0)
+    parser.add_argument("--check", action="store_true", help="exit 1 if a budget is exceeded")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'import':<8} {'median ms':>9} {'budget':>6}  lazy modules loaded")
+    for module, budget in IMPORT_BUDGET_MS.items():
+        runs = [import_time(module) for _ in range(args.runs)]
+        ms = statistics.median(r[0] for r in runs)
+        loaded = sorted({name for _, names in runs for name in names})
+        print(f"{module:<8} {ms:9.0f} {budget:6d}  {' '.join(loaded) or '-'}")
+        if ms > budget:
+            failures.append(f"import {module} took {ms:.0f} ms (budget {budget} ms)")
+        if loaded:
+            failures.append(f"import {module} loaded {', '.join(loaded)}")
+    with tempfile.TemporaryDirectory() as tmp:
+        stall = statistics.median(first_llm_stall(tmp) for _ in range(args.runs))
+    print(f"first LLM call: longest loop stall {stall:.0f} ms (budget {LOOP_STALL_BUDGET_MS} ms)")
+    if stall > LOOP_STALL_BUDGET_MS:
+        failures.append(f"first LLM call stalled the event loop {stall:.0f} ms (budget {LOOP_STALL_BUDGET_MS} ms)")
+    print()
+
+    fmt = lambda v: f"{v:8.2f}" if v is not None else "   never"  # noqa: E731
+    with tempfile.TemporaryDirectory() as tmp, \
+            FakeEventsServer(latency=args.latency, rss_items=args.items, engage_items=300, chrome=False) as server:
+        saved = os.path.join(tmp, "events.json")
+        write_snapshot(saved, server.base_url, args.items)
+        print(f"{args.items} RSS items, {args.latency * 1000:.0f} ms per response")
+        print(f"{'start':<6} {'run':>3} {'health s':>8} {'search s':>8}")
+        warm_health = []
+        for mode in ("cold", "warm"):
+            for run in range(args.runs):
+                env = {
+                    **os.environ,
+                    "SCRAPE_BASE_URL": server.base_url,
+                    "ENGAGE_API_URL": server.engage_url,
+                    "EVENTS_FILE": saved if mode == "warm" else os.path.join(tmp, f"cold-{run}.json"),
+                    "LLM_CACHE_FILE": "",
+                }
+                probe = repeated_terms_probe if mode == "warm" and run == 0 else None
+                health, search, failure = time_to_ready(env, args.query, args.deadline, probe)
+                print(f"{mode:<6} {run:3d} {fmt(health)} {fmt(search)}")
+                if failure:
+                    failures.append(f"result cache: {failure}")
+                if mode == "warm":
+                    warm_health.append(health if health is not None else float("inf"))
+    health = statistics.median(warm_health)
+    if health > WARM_HEALTH_BUDGET_S:
+        failures.append(f"warm start took {health:.2f} s to /health 200 (budget {WARM_HEALTH_BUDGET_S} s)")
+
+    for failure in failures:
+        print(f"over budget: {failure}")
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
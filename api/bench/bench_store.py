@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark: loading events.json vs. opening the columnar eventstore file.
+
+Run from api/:  python bench/bench_store.py [--events ../scraped/events.json] [--sizes 1694 20000 100000]
+
+Sizes above the source file's event count repeat its events with unique
+URLs. Times are the best of --repeat runs on a warm page cache.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from eventstore import EventStore, write_store  # noqa: E402
+from index import DateIndex  # noqa: E402
+
+DEFAULT_EVENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scraped", "events.json")
+
+
+def best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times) * 1000
+
+
+def json_load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["events"]
+
+
+def store_open(path):
+    EventStore(path).close()
+
+
+def store_sample(path):
+    with EventStore(path) as store:
+        step = max(1, len(store) // 10)
+        return [store[i] for i in range(0, len(store), step)]
+
+
+def store_events(path):
+    with EventStore(path) as store:
+        return store.events()
+
+
+def dates_json(path):
+    return DateIndex(json_load(path))
+
+
+def dates_store(path):
+    with EventStore(path) as store:
+        return DateIndex.from_columns(store.start_days, store.start_times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", default=DEFAULT_EVENTS)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1694, 20000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    source = json_load(args.events)
+    cases = [
+        ("json.load", json_load, "json"),
+        ("store open", store_open, "store"),
+        ("store 10 rows", store_sample, "store"),
+        ("store events()", store_events, "store"),
+        ("DateIndex json", dates_json, "json"),
+        ("DateIndex cols", dates_store, "store"),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'events':>7} {'json MB':>8} {'store MB':>9}  " + "  ".join(f"{c[0]:>14}" for c in cases))
+        for size in args.sizes:
+            events = [
+                dict(source[i % len(source)], url=f"{source[i % len(source)]['url']}#{i // len(source)}")
+                if i >= len(source) else source[i]
+                for i in range(size)
+            ]
+            paths = {"json": os.path.join(tmp, "events.json"), "store": os.path.join(tmp, "events.col")}
+            with open(paths["json"], "w", encoding="utf-8") as f:
+                json.dump({"scraped_at": None, "count": size, "events": events}, f, ensure_ascii=False)
+            write_store(paths["store"], events)
+            if store_events(paths["store"]) != json_load(paths["json"]):
+                print(f"{size}: store and JSON disagree", file=sys.stderr)
+                return 1
+            row = "  ".join(f"{best(lambda: fn(paths[kind]), args.repeat):11.2f} ms" for _, fn, kind in cases)
+            print(f"{size:7d} {os.path.getsize(paths['json']) / 1e6:8.2f} "
+                  f"{os.path.getsize(paths['store']) / 1e6:9.2f}  {row}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark: search latency as the expanded term list grows from 5 to 200 terms.
+
+Run from api/:  python bench/bench_terms.py [--events ../scraped/events.json] [--synthetic 100000]
+
+EXPAND_PROMPT asks Gemini for at least 50 keywords, so the request path
+scores long term lists. Each term count gets --queries lists of words
+drawn from the corpus's own vocabulary (the kind of words an expansion
+returns). Times are ms per query for the per-term scan (search.search,
+the reference scorer), TermIndex and MatrixIndex, both rankings; every
+index result is checked against the scan (weighted) or TermIndex (bm25f).
+With --synthetic N the sweep also runs on bench_matrix's generated corpus
+of N events, where the scan is skipped above --scan-max.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bench_matrix import keyed, make_events, make_vocab  # noqa: E402
+from bench_semantic import DEFAULT_EVENTS  # noqa: E402
+from index import TermIndex  # noqa: E402
+from matrix import MatrixIndex  # noqa: E402
+from search import load_events, search  # noqa: E402
+from semantic import tokens  # noqa: E402
+
+TERM_COUNTS = (5, 20, 50, 100, 200)
+
+
+def corpus_words(events, limit=3000):
+    counts = Counter(t for e in events for t in tokens(f"{e.get('title') or ''} {e.get('description') or ''}"))
+    return [w for w, _ in counts.most_common(limit) if w.isalpha() and len(w) > 2]
+
+
+def timed(fn, queries):
+    fn(queries[0])  # fill per-generation memos (BM25 df, MatrixIndex vocab matches)
+    t0 = time.perf_counter()
+    results = [fn(q) for q in queries]
+    return (time.perf_counter() - t0) * 1000 / len(queries), results
+
+
+def sweep(name, events, words, args, rng):
+    print(f"\n{name}: {len(events)} events, {args.queries} queries per term count, top {args.top}; ms per query")
+    t0 = time.perf_counter()
+    terms_index = TermIndex(events)
+    matrix = MatrixIndex(events)
+    print(f"indexes built in {time.perf_counter() - t0:.1f} s")
+    print(f"{'terms':>5} {'scan':>9} {'index':>8} {'matrix':>8} {'idx bm25':>8} {'mx bm25':>8}")
+    for count in TERM_COUNTS:
+        queries = [rng.sample(words, count) for _ in range(args.queries)]
+        t_ms, t_res = timed(lambda q: terms_index.search(q, args.top), queries)
+        m_ms, m_res = timed(lambda q: matrix.search(q, args.top), queries)
+        tb_ms, tb_res = timed(lambda q: terms_index.search(q, args.top, ranking="bm25f"), queries)
+        mb_ms, mb_res = timed(lambda q: matrix.search(q, args.top, ranking="bm25f"), queries)
+        scan = f"{'-':>9}"
+        if len(events) <= args.scan_max:
+            s_ms, s_res = timed(lambda q: search(events, q, len(events)), queries)
+            # search() sorts ties arbitrarily; compare the score multiset of the full ranking.
+            full = [terms_index.search(q, len(events)) for q in queries]
+            if [sorted(s for s, _ in r) for r in s_res] != [sorted(s for s, _ in r) for r in full]:
+                print(f"{count} terms: TermIndex scores differ from the scan", file=sys.stderr)
+                return False
+            scan = f"{s_ms:9.2f}"
+        if keyed(t_res) != keyed(m_res) or keyed(tb_res) != keyed(mb_res):
+            print(f"{count} terms: MatrixIndex and TermIndex results differ", file=sys.stderr)
+            return False
+        print(f"{count:5d} {scan} {t_ms:8.2f} {m_ms:8.2f} {tb_ms:8.2f} {mb_ms:8.2f}")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", default=DEFAULT_EVENTS)
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N")
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--scan-max", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    events = load_events(args.events)
+    if not sweep("snapshot", events, corpus_words(events), args, rng):
+        return 1
+    if args.synthetic:
+        vocab = make_vocab(30000, rng)
+        if not sweep("synthetic", make_events(args.synthetic, vocab, rng), vocab[:3000], args, rng):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark: the original dateparser-based extract_date_range() vs. extract_when().
+
+Run from api/:  python bench/bench_when.py [--repeat 20]
+
+Per-query cost is the mean over --repeat warm calls. "first call" is
+measured in a fresh interpreter, so it includes importing dateparser
+where that path needs it. TIME_CASES are checked first, and any mismatch
+fails the run with exit status 1.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from datetime import date, time as clock, timedelta
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, API_DIR)
+
+from search import extract_when  # noqa: E402
+
+QUERIES = [
+    "jazz tonight", "free food tomorrow", "concerts this weekend", "career fair next week",
+    "art exhibits next month", "talks in april", "yoga on friday", "hackathon next saturday",
+    "lectures this week", "movies 2026-04-10", "recital 4/18", "dance show april 12th",
+    "volunteer two weeks from now", "upcoming workshops", "trivia after 6pm", "coffee before noon",
+    "study hall between 2 and 4pm", "open mic at 8pm", "morning yoga", "saturday night party",
+    "afternoon seminar", "jazz concert", "free pizza", "chess club", "robotics", "career fair",
+    "poetry reading", "top 10 art shows", "march for science", "basketball game",
+]
+
+
+# Query → time range extract_when() must find. Bare numbers after
+# from/by/at/after are counts or names, not clock times; "2-4pm" is a range
+# without "between", "ages 2-4" is not.
+TIME_CASES = {
+    "talks from 3 speakers": None,
+    "hosted by 4-h club": None,
+    "5k run at 5": None,
+    "ages between 2 and 4": None,
+    "top 10 art shows": None,
+    "at one point": None,
+    "trivia after 6pm": (clock(18), None),
+    "coffee before noon": (None, clock(12)),
+    "open mic at 8pm": (clock(20), clock(21)),
+    "movie at 7:30": (clock(19, 30), clock(20, 30)),
+    "study hall between 2 and 4pm": (clock(14), clock(16)),
+    "from 10am to 2pm": (clock(10), clock(14)),
+    "ages 2-4": None,
+    "study session 2-4pm": (clock(14), clock(16)),
+    "workshop 10am to 2pm": (clock(10), clock(14)),
+    "open 9am-5pm": (clock(9), clock(17)),
+    "yoga 7-8am": (clock(7), clock(8)),
+    "lunch noon-1pm": (clock(12), clock(13)),
+}
+
+
+def check_time_cases():
+    """Mismatches between extract_when() and TIME_CASES, as printable lines."""
+    return [
+        f"{query!r}: expected {expected}, got {found}"
+        for query, expected in TIME_CASES.items()
+        for found in [extract_when(query)[1]]
+        if found != expected
+    ]
+
+
+def original_extract_date_range(query):
+    """extract_date_range() before the built-in resolver."""
+    import dateparser.search
+
+    q = query.lower()
+    today = date.today()
+    if "tonight" in q:
+        return (today, today)
+    if "tomorrow" in q:
+        d = today + timedelta(days=1)
+        return (d, d)
+    if "this weekend" in q or "weekend" in q:
+        days_to_sat = (5 - today.weekday()) % 7 or 7
+        sat = today + timedelta(days=days_to_sat)
+        return (sat, sat + timedelta(days=1))
+    if "next week" in q:
+        mon = today + timedelta(days=(7 - today.weekday()))
+        return (mon, mon + timedelta(days=6))
+    try:
+        results = dateparser.search.search_dates(query, languages=["en"])
+        if results:
+            found = results[0][1].date()
+            return (found, found)
+    except Exception:
+        pass
+    return None
+
+
+FIRST_CALL = {
+    "original": "import bench_when as b; b.original_extract_date_range({q!r})",
+    "extract_when": "from search import extract_when; extract_when({q!r})",
+}
+
+
+def first_call(kind, query):
+    code = (
+        "import sys, time; sys.path[:0] = [{api!r}, {bench!r}]; t = time.perf_counter(); "
+        + FIRST_CALL[kind].format(q=query)
+        + "; print(time.perf_counter() - t)"
+    ).format(api=API_DIR, bench=os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=API_DIR, check=True)
+    return float(out.stdout.strip().splitlines()[-1]) * 1000
+
+
+def per_query(fn, query, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(query)
+    return (time.perf_counter() - t0) * 1e6 / repeat, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    failures = check_time_cases()
+    for failure in failures:
+        print(f"time case failed: {failure}")
+    if failures:
+        return 1
+    print(f"{len(TIME_CASES)} time cases ok")
+    print(f"first call (fresh process, query {QUERIES[0]!r}): "
+          + ", ".join(f"{kind} {first_call(kind, QUERIES[0]):.0f} ms" for kind in FIRST_CALL))
+    original_extract_date_range(QUERIES[0])  # import dateparser outside the timings
+    print(f"\n{'query':<32} {'original us':>11} {'new us':>8}  new dates / times")
+    totals = {"original": [], "new": []}
+    for query in QUERIES:
+        old_us, _ = per_query(original_extract_date_range, query, args.repeat)
+        new_us, (dates, times) = per_query(extract_when, query, args.repeat)
+        totals["original"].append(old_us)
+        totals["new"].append(new_us)
+        when = " / ".join(
+            f"{r[0]}..{r[1]}" if r else "-" for r in (dates, times)
+        )
+        print(f"{query:<32} {old_us:11.0f} {new_us:8.1f}  {when}")
+    print(f"{'mean':<32} {sum(totals['original']) / len(QUERIES):11.0f} "
+          f"{sum(totals['new']) / len(QUERIES):8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
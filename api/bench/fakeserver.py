@@ -0,0 +1,259 @@
+"""Local stand-in for events.unl.edu and the Campus Labs Engage API, for benchmarks.
+
+Serves synthetic but structurally faithful responses:
+
+    /upcoming/?format=rss&limit=N         RSS feed (``rss_items`` items, or N if smaller)
+    /YYYY/MM/DD/<id>/                     event detail page (ld+json, group, audience)
+    /engage/api/discovery/event/search    Engage JSON pages (take/skip, @odata.count)
+
+``latency`` is added to every response and ``connect_latency`` to every new
+TCP connection (a stand-in for the TLS handshake), and connections and
+requests are counted, so pooling and concurrency changes show up the way
+they would against the real hosts.
+"""
+
+import html
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+GROUPS = [
+    "Department of Computer Science", "Lied Center for Performing Arts", "University Libraries",
+    "Nebraska Athletics", "Raikes School", "Office of Research and Economic Development",
+    "Glenn Korff School of Music", "Campus Recreation", "Sheldon Museum of Art",
+]
+AUDIENCES = ["Public", "Students", "Faculty", "Staff", "Alumni"]
+WORDS = (
+    "workshop lecture concert seminar pizza volunteer research career fair jazz hackathon "
+    "study abroad yoga robotics theatre art exhibit networking football recital coffee "
+    "community outreach panel discussion film screening sustainability wellness"
+).split()
+
+# Site chrome that real detail pages carry around the event body.
+_NAV = "".join(
+    f'<li class="dcf-nav-item"><a href="/nav/{i}/">Navigation link {i}</a>'
+    f'<ul>{"".join(f"<li><a href=/nav/{i}/{j}/>Sub item {j}</a></li>" for j in range(12))}</ul></li>'
+    for i in range(40)
+)
+_FOOTER = "".join(f'<div class="dcf-footer-col"><p>Footer paragraph {i}. ' + "Lorem ipsum " * 30 + "</p></div>"
+                  for i in range(12))
+
+
+def _event_start(event_id: int) -> datetime:
+    return datetime(2026, 3, 1, 8, 0) + timedelta(hours=(event_id * 7) % (24 * 60))
+
+
+def _event_words(event_id: int, n: int) -> str:
+    rng = random.Random(event_id)
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def detail_path(event_id: int) -> str:
+    start = _event_start(event_id)
+    return f"/{start:%Y/%m/%d}/{event_id}/"
+
+
+def detail_page(event_id: int, chrome: bool = True) -> str:
+    """A detail page shaped like events.unl.edu's, roughly the same size.
+
+    ``chrome=False`` drops the navigation and footer, leaving a ~3 KB page for
+    benchmarks that should measure fetching rather than parsing."""
+    rng = random.Random(event_id)
+    title = _event_words(event_id, 4).title()
+    group = rng.choice(GROUPS)
+    audiences = rng.sample(AUDIENCES, rng.randint(1, 3))
+    start = _event_start(event_id)
+    ld = {
+        "@context": "https://schema.org",
+        "@type": "Event",
+        "name": title,
+        "startDate": start.isoformat() + "-06:00",
+        "image": [f"//events.unl.edu/images/{event_id}/large.jpg?a=1&amp;b=2"],
+        "location": {"@type": "Place", "name": "Nebraska Union"},
+    }
+    audience_links = "".join(
+        f'<a class="dcf-badge" href="//events.unl.edu/audience/?audience={a}">{a}</a> ' for a in audiences
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)} | Events</title>"
+        '<link rel="stylesheet" href="/wdn/templates_5.3/css/all.css">'
+        f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+        "</head><body>"
+        f'<header><nav><ul class="dcf-nav">{_NAV if chrome else ""}</ul></nav></header>'
+        '<main id="dcf-main"><div class="vevent">'
+        f'<h1 class="summary">{html.escape(title)}</h1>'
+        f'<p class="description">{_event_words(event_id + 1, 80)}</p>'
+        f'<div class="unl-event-audience">Audience: {audience_links}</div>'
+        f'<p class="eventicon-calendar">This event originated in <a href="/{group.replace(" ", "")}/">'
+        f"{html.escape(group)}</a>.</p>"
+        "</div></main>"
+        f"<footer>{_FOOTER if chrome else ''}</footer></body></html>"
+    )
+
+
+def rss_item(base_url: str, event_id: int) -> str:
+    rng = random.Random(event_id)
+    start = _event_start(event_id)
+    end = start + timedelta(hours=rng.randint(1, 3))
+    group = rng.choice(GROUPS)
+    desc = (
+        f"<small>{start:%a, %b %d, %Y}</small>"
+        f'<small><abbr class="dtstart" title="{start.isoformat()}-06:00">{start:%I:%M %p}</abbr> – '
+        f'<abbr class="dtend" title="{end.isoformat()}-06:00">{end:%I:%M %p}</abbr></small>'
+        f"<small>Room {rng.randint(100, 400)}, Nebraska Union</small>"
+        f"<p>{_event_words(event_id + 2, 40)}</p>"
+        f"{group}Status: CONFIRMED | - |"
+    )
+    return (
+        "<item>"
+        f"<title>{html.escape(_event_words(event_id, 4).title())}</title>"
+        f"<link>{base_url.rstrip('/')}{detail_path(event_id)}</link>"
+        f"<description>{html.escape(desc)}</description>"
+        f"<pubDate>{start:%a, %d %b %Y %H:%M:%S} -0600</pubDate>"
+        "</item>"
+    )
+
+
+def rss_feed(base_url: str, count: int) -> str:
+    items = "".join(rss_item(base_url, i) for i in range(count))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>UNL Events</title><link>{base_url}</link>{items}</channel></rss>"
+    )
+
+
+def engage_item(event_id: int) -> dict:
+    rng = random.Random(-event_id - 1)
+    start = _event_start(event_id)
+    return {
+        "id": str(900000 + event_id),
+        "name": _event_words(-event_id - 1, 3).title(),
+        "startsOn": start.isoformat() + "+00:00",
+        "endsOn": (start + timedelta(hours=2)).isoformat() + "+00:00",
+        "location": "Nebraska Union",
+        "description": f"<p>{_event_words(-event_id - 2, 50)}</p><p><strong>Free</strong> food!</p>",
+        "organizationName": rng.choice(GROUPS),
+        "imagePath": f"{event_id}.png",
+        "categoryNames": rng.sample(["Social", "Academic", "Service", "Arts"], 2),
+    }
+
+
+class FakeEventsServer:
+    """Threaded HTTP/1.1 server on 127.0.0.1, used as a context manager."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        connect_latency: float = 0.0,
+        rss_items: int = 0,
+        engage_items: int = 0,
+        fail_rate: float = 0.0,
+        chrome: bool = True,
+    ):
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.rss_items = rss_items
+        self.engage_items = engage_items
+        self.fail_rate = fail_rate
+        self.chrome = chrome
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(0)
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._rss_cache: dict = {}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def engage_url(self) -> str:
+        return self.base_url + "engage/api/discovery/event/search"
+
+    def detail_urls(self, count: int) -> List[str]:
+        return [self.base_url.rstrip("/") + detail_path(i) for i in range(count)]
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self) -> "FakeEventsServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+                if server.connect_latency:
+                    time.sleep(server.connect_latency)
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    fail = server.fail_rate and server._rng.random() < server.fail_rate
+                if server.latency:
+                    time.sleep(server.latency)
+                if fail:
+                    return self._send(503, "text/plain", b"try again")
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path.startswith("/upcoming/"):
+                    limit = int(query.get("limit", ["-1"])[0])
+                    count = server.rss_items if limit < 0 else min(limit, server.rss_items)
+                    body = server._rss_cache.get(count)
+                    if body is None:
+                        body = server._rss_cache[count] = rss_feed(server.base_url, count).encode()
+                    return self._send(200, "application/rss+xml", body)
+                if url.path.startswith("/engage/"):
+                    take = int(query.get("take", ["100"])[0])
+                    skip = int(query.get("skip", ["0"])[0])
+                    ids = range(skip, min(skip + take, server.engage_items))
+                    payload = {"@odata.count": server.engage_items, "value": [engage_item(i) for i in ids]}
+                    return self._send(200, "application/json", json.dumps(payload).encode())
+                parts = [p for p in url.path.split("/") if p]
+                if len(parts) == 4 and parts[3].isdigit():
+                    return self._send(200, "text/html; charset=utf-8", detail_page(int(parts[3]), server.chrome).encode())
+                self._send(404, "text/plain", b"not found")
+
+            def _send(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 4096
+
+            def handle_error(self, request, client_address):
+                # Clients hanging up mid-response (e.g. a benchmarked process
+                # being stopped) are expected; anything else is reported.
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self._httpd = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,169 @@
+"""Bounded in-process caches with TTL expiry and hit/miss/eviction counters."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+log = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe LRU cache; entries also expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._store(key, expires_at, value)
+            while len(self._data) > self.maxsize:
+                old_key, _ = self._data.popitem(last=False)
+                self._discard(old_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._data):
+                self._discard(key)
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    # Persistence hooks, called with the lock held.
+    def _store(self, key: Hashable, expires_at: Optional[float], value: Any) -> None:
+        pass
+
+    def _discard(self, key: Hashable) -> None:
+        pass
+
+
+class PersistentLRUCache(LRUCache):
+    """LRUCache written through to a local SQLite file so entries survive restarts.
+
+    Keys must be JSON-serializable; ``encode``/``decode`` convert values to and
+    from JSON-compatible data. With an empty ``path``, or after a disk error
+    (which is logged), the cache carries on in memory only.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        maxsize: int,
+        ttl: Optional[float] = None,
+        encode: Callable[[Any], Any] = lambda v: v,
+        decode: Callable[[Any], Any] = lambda v: v,
+    ):
+        super().__init__(maxsize, ttl)
+        self.path = path
+        self._encode = encode
+        self._decode = decode
+        self._db: Optional[sqlite3.Connection] = None
+        if not path:
+            return
+        try:
+            self._open()
+        except (sqlite3.Error, OSError) as exc:
+            log.warning("Cache file %s unavailable, using memory only: %s", path, exc)
+            self._db = None
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, stored_at REAL NOT NULL)"
+        )
+        db.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        rows = db.execute(
+            "SELECT key, value, expires_at FROM entries ORDER BY stored_at DESC LIMIT ?",
+            (self.maxsize,),
+        ).fetchall()
+        self._db = db
+        for raw_key, raw_value, expires_at in reversed(rows):
+            try:
+                key = _to_key(json.loads(raw_key))
+                value = self._decode(json.loads(raw_value))
+            except (ValueError, TypeError, KeyError):
+                continue
+            self._data[key] = (expires_at, value)
+
+    def _store(self, key: Hashable, expires_at: Optional[float], value: Any) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+                (json.dumps(key), json.dumps(self._encode(value)), expires_at, time.time()),
+            )
+        except sqlite3.Error as exc:
+            log.warning("Cache write to %s failed: %s", self.path, exc)
+
+    def _discard(self, key: Hashable) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (json.dumps(key),))
+        except sqlite3.Error as exc:
+            log.warning("Cache delete from %s failed: %s", self.path, exc)
+
+    def stats(self) -> Dict[str, Any]:
+        payload = super().stats()
+        payload["persistent"] = self._db is not None
+        return payload
+
+
+def _to_key(value: Any) -> Hashable:
+    """JSON turns tuple keys into lists; turn them back so lookups match."""
+    if isinstance(value, list):
+        return tuple(_to_key(v) for v in value)
+    return value
@@ -0,0 +1,75 @@
+"""Per-generation event digests, so clients can fetch only what changed since a generation."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+Digests = Dict[str, str]
+
+
+def event_keys(events: List[Dict[str, Any]]) -> List[str]:
+    """A stable identity per event: its URL, suffixed if a URL repeats in one snapshot."""
+    seen: Dict[str, int] = {}
+    keys = []
+    for event in events:
+        url = event.get("url") or ""
+        n = seen.get(url, 0)
+        seen[url] = n + 1
+        keys.append(url if n == 0 else f"{url}#{n}")
+    return keys
+
+
+def event_digest(event: Dict[str, Any]) -> str:
+    raw = json.dumps(event, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ChangeLog:
+    """Key → digest maps for the last ``history`` generations.
+
+    A diff from any remembered generation to the current one is computed on
+    demand: keys only in the current snapshot are added, keys only in the old
+    one removed, and keys whose digest differs updated. Older (or unknown)
+    generations get None, meaning the client must resync in full.
+    """
+
+    def __init__(self, history: int):
+        self.history = history
+        self._digests: "OrderedDict[int, Digests]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, generation: int, events: List[Dict[str, Any]]) -> None:
+        digests = dict(zip(event_keys(events), map(event_digest, events)))
+        with self._lock:
+            self._digests[generation] = digests
+            while len(self._digests) > self.history:
+                self._digests.popitem(last=False)
+
+    def diff(self, since: int, generation: int, events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Changes from ``since`` to ``generation`` (whose events are given), or None."""
+        with self._lock:
+            old = self._digests.get(since)
+            new = self._digests.get(generation)
+        if old is None or new is None:
+            return None
+        added: List[Dict[str, Any]] = []
+        updated: List[Dict[str, Any]] = []
+        for key, event in zip(event_keys(events), events):
+            digest = old.get(key)
+            if digest is None:
+                added.append(event)
+            elif digest != new[key]:
+                updated.append(event)
+        removed = [key for key in old if key not in new]
+        return {"added": added, "updated": updated, "removed": removed}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            generations = list(self._digests)
+        return {
+            "history": self.history,
+            "oldest_generation": generations[0] if generations else None,
+            "newest_generation": generations[-1] if generations else None,
+        }
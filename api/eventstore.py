@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Columnar, mmap-able snapshot of the events list, as an alternative to events.json.
+
+Layout (little-endian, every section 8-byte aligned):
+
+    header      magic, version, event count, string count, scraped_at string id, generation
+    sections    (offset, length) pairs, in SECTIONS order
+    strings     uint32 end offsets into one UTF-8 blob; each distinct value is stored once
+    <field>     one uint32 string id per event for every scalar Event field (NONE = null)
+    audience    uint32 per-event offsets into a flat uint32 id list, plus a null mask
+    start/end   pre-parsed int32 day ordinal and int64 microsecond-of-day, in the
+                event's own UTC offset (-1 day = missing or unparseable)
+
+Opening a store only maps the file and checks the header, and a single row
+decodes on access. The service and search.load_events() still decode the
+whole file into dicts with events(), since every index needs the text;
+there the gain is a faster load than json.load, a smaller file, and start
+columns that DateIndex reads without parsing timestamps. Files are written
+to a temp file and renamed into place, so readers never see a partial write.
+
+    python eventstore.py scraped/events.json scraped/events.col   # JSON → columnar
+    python eventstore.py scraped/events.col out.json              # columnar → JSON
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+MAGIC = b"UNLEVTS\x00"
+VERSION = 2
+NONE = 0xFFFFFFFF
+
+STRING_FIELDS = ("title", "url", "start", "end", "location", "description", "group", "image_url", "source")
+SECTIONS = (
+    "string_ends", "string_blob",
+    *STRING_FIELDS,
+    "audience_offsets", "audience_ids", "audience_null",
+    "start_day", "start_time", "end_day", "end_time",
+)
+_HEADER = struct.Struct("<8sIIIIQ")
+_SECTION = struct.Struct("<QQ")
+_CODES = {"string_blob": "B", "audience_null": "B", "start_day": "i", "end_day": "i",
+          "start_time": "q", "end_time": "q"}
+
+
+def day_and_time(raw: Optional[str]) -> Tuple[int, int]:
+    """(day ordinal, microseconds since midnight) of an ISO timestamp, or (-1, 0)."""
+    if not raw:
+        return -1, 0
+    try:
+        dt = datetime.fromisoformat(raw[:25])
+    except ValueError:
+        return -1, 0
+    t = dt.time()
+    return dt.date().toordinal(), ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def is_store(path: str) -> bool:
+    """True if ``path`` starts with the columnar store's magic bytes."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write ``data`` to a temp file next to ``path``, then rename it over ``path``."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def encode_store(
+    events: Sequence[Dict[str, Any]],
+    scraped_at: Optional[str] = None,
+    generation: int = 0,
+) -> bytes:
+    """Serialize event dicts (as saved in events.json) to the columnar format."""
+    ids: Dict[str, int] = {}
+    blob = bytearray()
+    ends: List[int] = []
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        sid = ids.get(value)
+        if sid is None:
+            sid = ids[value] = len(ends)
+            blob.extend(value.encode("utf-8"))
+            ends.append(len(blob))
+        return sid
+
+    columns: Dict[str, List[int]] = {f: [] for f in STRING_FIELDS}
+    aud_offsets, aud_ids, aud_null = [0], [], []
+    times: Dict[str, List[int]] = {k: [] for k in ("start_day", "start_time", "end_day", "end_time")}
+    for event in events:
+        for field in STRING_FIELDS:
+            columns[field].append(intern(event.get(field)))
+        audience = event.get("audience")
+        aud_null.append(audience is None)
+        aud_ids.extend(intern(a) for a in audience or ())
+        aud_offsets.append(len(aud_ids))
+        for prefix in ("start", "end"):
+            day, micros = day_and_time(event.get(prefix))
+            times[prefix + "_day"].append(day)
+            times[prefix + "_time"].append(micros)
+    scraped_id = intern(scraped_at)
+    if len(blob) >= NONE:
+        raise ValueError("string table too large for 32-bit offsets")
+
+    payloads = {
+        "string_ends": _pack("I", ends),
+        "string_blob": bytes(blob),
+        **{f: _pack("I", columns[f]) for f in STRING_FIELDS},
+        "audience_offsets": _pack("I", aud_offsets),
+        "audience_ids": _pack("I", aud_ids),
+        "audience_null": bytes(aud_null),
+        **{k: _pack(_CODES[k], v) for k, v in times.items()},
+    }
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(events), len(ends), scraped_id, generation))
+    table_at = len(out)
+    out.extend(b"\0" * _SECTION.size * len(SECTIONS))
+    table = []
+    for name in SECTIONS:
+        out.extend(b"\0" * (-len(out) % 8))
+        table.append((len(out), len(payloads[name])))
+        out.extend(payloads[name])
+    out[table_at:table_at + _SECTION.size * len(SECTIONS)] = b"".join(_SECTION.pack(*t) for t in table)
+    return bytes(out)
+
+
+def _pack(code: str, values: List[int]) -> bytes:
+    return struct.pack(f"<{len(values)}{code}", *values)
+
+
+def write_store(
+    path: str,
+    events: Sequence[Dict[str, Any]],
+    scraped_at: Optional[str] = None,
+    generation: int = 0,
+) -> None:
+    atomic_write(path, encode_store(events, scraped_at, generation))
+
+
+class EventStore:
+    """Read-only view of a columnar snapshot file.
+
+    Indexing returns the same dicts events.json holds; ``events()`` decodes
+    everything at once, sharing repeated strings. The pre-parsed start
+    columns feed DateIndex.from_columns() without parsing timestamps again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Columns are cast to native ints, which only match the file on little-endian hosts.
+            if sys.byteorder != "little":
+                raise ValueError("event stores can only be read on little-endian hosts")
+            magic, version, self._n, self._n_strings, scraped_id, self.generation = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} event store")
+            view = memoryview(self._mm)
+            self._views = [view]
+            self._cols: Dict[str, memoryview] = {}
+            for i, name in enumerate(SECTIONS):
+                offset, length = _SECTION.unpack_from(self._mm, _HEADER.size + i * _SECTION.size)
+                if offset + length > len(self._mm):
+                    raise ValueError(f"{path} is truncated")
+                section = view[offset:offset + length]
+                self._views.append(section)
+                if name != "string_blob":
+                    section = section.cast(_CODES.get(name, "I"))
+                    self._views.append(section)
+                self._cols[name] = section
+        except (struct.error, TypeError) as exc:
+            self.close()
+            raise ValueError(f"{path} is not a valid event store: {exc}") from exc
+        except Exception:
+            self.close()
+            raise
+        self._blob = self._cols["string_blob"]
+        self._ends = self._cols["string_ends"]
+        self.scraped_at = self._string(scraped_id)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __enter__(self) -> "EventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self._mm.close()
+
+    def _string(self, sid: int) -> Optional[str]:
+        if sid == NONE:
+            return None
+        start = self._ends[sid - 1] if sid else 0
+        return str(self._blob[start:self._ends[sid]], "utf-8")
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        if not -self._n <= i < self._n:
+            raise IndexError(i)
+        i %= self._n
+        event: Dict[str, Any] = {f: self._string(self._cols[f][i]) for f in STRING_FIELDS}
+        event["audience"] = self._audience(i, self._string)
+        return {f: event[f] for f in _EVENT_KEYS}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[i] for i in range(self._n))
+
+    def _audience(self, i: int, lookup) -> Optional[List[str]]:
+        if self._cols["audience_null"][i]:
+            return None
+        offsets = self._cols["audience_offsets"]
+        return [lookup(sid) for sid in self._cols["audience_ids"][offsets[i]:offsets[i + 1]]]
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Every event as a dict, decoding each distinct string once."""
+        strings = {sid: self._string(sid) for sid in range(self._n_strings)}
+        strings[NONE] = None
+        columns = {f: map(strings.__getitem__, self._cols[f]) for f in STRING_FIELDS}
+        offsets = self._cols["audience_offsets"].tolist()
+        ids = list(map(strings.__getitem__, self._cols["audience_ids"]))
+        columns["audience"] = (
+            None if null else ids[offsets[i]:offsets[i + 1]]
+            for i, null in enumerate(self._cols["audience_null"])
+        )
+        return [dict(zip(_EVENT_KEYS, row)) for row in zip(*(columns[f] for f in _EVENT_KEYS))]
+
+    @property
+    def start_days(self) -> memoryview:
+        return self._cols["start_day"]
+
+    @property
+    def start_times(self) -> memoryview:
+        return self._cols["start_time"]
+
+
+# Key order of asdict(Event), so dicts compare and serialize like events.json.
+_EVENT_KEYS = ("title", "url", "start", "end", "location", "description", "group",
+               "image_url", "audience", "source")
+
+
+def read_events(path: str) -> Dict[str, Any]:
+    """The events.json payload (scraped_at, generation, count, events) from either format,
+    chosen by the file's magic bytes."""
+    if is_store(path):
+        with EventStore(path) as store:
+            events = store.events()
+            return {"scraped_at": store.scraped_at, "generation": store.generation,
+                    "count": len(events), "events": events}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Convert between events.json and the columnar event store.")
+    parser.add_argument("source", help="events.json or a columnar store")
+    parser.add_argument("dest", help="output path; the format is the opposite of the source's")
+    args = parser.parse_args()
+
+    payload = read_events(args.source)
+    events = payload["events"]
+    if is_store(args.source):
+        atomic_write(args.dest, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    else:
+        write_store(args.dest, events, payload.get("scraped_at"), payload.get("generation") or 0)
+    print(f"Wrote {len(events)} events to {args.dest} ({os.path.getsize(args.dest):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
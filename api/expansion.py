@@ -0,0 +1,154 @@
+"""Local query expansion: related terms from corpus co-occurrence (NPMI) plus seed synonyms."""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # seed synonyms only
+    np = None
+
+from semantic import tokens
+
+# Each group's words expand to one another. Kept to everyday synonyms and
+# hypernyms a campus events query might use; corpus co-occurrence adds the rest.
+SEED_GROUPS: Tuple[Tuple[str, ...], ...] = (
+    ("food", "pizza", "lunch", "dinner", "breakfast", "snacks", "refreshments", "meal"),
+    ("music", "concert", "band", "choir", "orchestra", "recital", "symphony", "ensemble"),
+    ("sports", "athletics", "game", "match", "tournament", "huskers"),
+    ("fitness", "workout", "exercise", "yoga", "gym"),
+    ("art", "exhibit", "exhibition", "gallery", "museum", "artist"),
+    ("career", "job", "internship", "employer", "hiring", "resume"),
+    ("volunteer", "service", "outreach", "donate"),
+    ("talk", "lecture", "seminar", "colloquium", "speaker", "presentation"),
+    ("theater", "theatre", "play", "musical", "drama"),
+    ("health", "wellness", "counseling", "mindfulness", "meditation"),
+    ("coding", "programming", "software", "computer", "hackathon"),
+    ("movie", "film", "screening", "cinema", "documentary"),
+    ("kids", "children", "family", "youth"),
+    ("networking", "mixer", "professional", "alumni"),
+    ("writing", "poetry", "author", "literature", "reading"),
+    ("study", "tutoring", "exam", "academic"),
+    ("religion", "faith", "worship", "prayer", "church"),
+    ("dance", "ballet", "ballroom", "dancing"),
+    ("startup", "entrepreneurship", "business", "venture", "pitch"),
+    ("nature", "outdoor", "hike", "garden", "prairie", "environment"),
+    ("party", "celebration", "social", "festival"),
+    ("free", "complimentary"),
+)
+
+MIN_DF = 3
+# Terms in more than this share of events are too generic to expand or to
+# expand into.
+MAX_DF_RATIO = 0.1
+MAX_VOCAB = 4000
+MIN_COOCCUR = 5
+MIN_NPMI = 0.5
+RELATED_PER_TERM = 3
+# Expansion targets must appear in at least this many titles or group names,
+# which keeps description filler ("provides", "enables") out of the table.
+MIN_TITLE_DF = 2
+_BLOCK_ROWS = 4096
+_CALENDAR = {
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+}
+
+
+def _event_text(event: Dict[str, Any]) -> str:
+    return " ".join(filter(None, (event.get("title"), event.get("group"), event.get("description"))))
+
+
+class ExpansionTable:
+    """term → related terms, rebuilt with every snapshot.
+
+    Events are deduplicated by title so recurring events count once. Two
+    terms are related when they co-occur in at least MIN_COOCCUR events and
+    their normalized PMI is at least MIN_NPMI; each term keeps its
+    RELATED_PER_TERM strongest partners. Seed synonyms come first, limited
+    to words the corpus contains. Without numpy only the seeds are used.
+    """
+
+    def __init__(
+        self,
+        events: List[Dict[str, Any]],
+        seeds: Iterable[Sequence[str]] = SEED_GROUPS,
+        cooccurrence: bool = True,
+    ):
+        docs: Dict[str, Set[str]] = {}
+        titled: Counter = Counter()
+        for event in events:
+            title = (event.get("title") or "").lower()
+            if title not in docs:
+                docs[title] = set(tokens(_event_text(event)))
+                titled.update(set(tokens(f"{event.get('title') or ''} {event.get('group') or ''}")))
+        df: Counter = Counter(t for doc in docs.values() for t in doc)
+
+        related: Dict[str, List[str]] = {}
+        for group in seeds:
+            present = [w for w in group if df[w]]
+            for word in group:
+                related.setdefault(word, []).extend(w for w in present if w != word)
+        if cooccurrence and np is not None:
+            for term, partners in self._cooccurring(list(docs.values()), df, titled).items():
+                related.setdefault(term, []).extend(partners)
+        self.related: Dict[str, Tuple[str, ...]] = {
+            term: tuple(dict.fromkeys(words)) for term, words in related.items() if words
+        }
+
+    def __len__(self) -> int:
+        return len(self.related)
+
+    @staticmethod
+    def _cooccurring(docs: List[Set[str]], df: Counter, titled: Counter) -> Dict[str, List[str]]:
+        n = len(docs)
+        vocab = sorted(
+            (t for t, c in df.items()
+             if MIN_DF <= c <= MAX_DF_RATIO * n and t.isalpha() and len(t) > 2 and t not in _CALENDAR),
+            key=lambda t: (-df[t], t),
+        )[:MAX_VOCAB]
+        if len(vocab) < 2:
+            return {}
+        col = {t: i for i, t in enumerate(vocab)}
+        counts = np.zeros((len(vocab), len(vocab)), dtype=np.float32)
+        for lo in range(0, n, _BLOCK_ROWS):
+            block = np.zeros((min(_BLOCK_ROWS, n - lo), len(vocab)), dtype=np.float32)
+            for row, doc in enumerate(docs[lo:lo + _BLOCK_ROWS]):
+                block[row, [col[t] for t in doc if t in col]] = 1
+            counts += block.T @ block
+        dfs = np.diag(counts).copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            npmi = np.log(counts * n / np.outer(dfs, dfs)) / -np.log(counts / n)
+        npmi[counts < MIN_COOCCUR] = -1
+        np.fill_diagonal(npmi, -1)
+        npmi[:, [titled[t] < MIN_TITLE_DF for t in vocab]] = -1
+
+        table: Dict[str, List[str]] = {}
+        for i, term in enumerate(vocab):
+            best = np.argsort(-npmi[i], kind="stable")[:RELATED_PER_TERM * 4]
+            # Substring matching already covers "volunteers" for "volunteer".
+            partners = [vocab[j] for j in best.tolist()
+                        if npmi[i, j] >= MIN_NPMI and term not in vocab[j] and vocab[j] not in term]
+            if partners:
+                table[term] = partners[:RELATED_PER_TERM]
+        return table
+
+    def lookup(self, term: str) -> Tuple[str, ...]:
+        """Related terms of ``term``, or of its stem without a plural "s" or "ing"."""
+        found = self.related.get(term)
+        for suffix in ("s", "ing"):
+            if found is None and len(term) > len(suffix) + 2 and term.endswith(suffix):
+                found = self.related.get(term[:-len(suffix)])
+        return found or ()
+
+    def expand(self, terms: List[str]) -> List[str]:
+        """Related terms for ``terms``, in table order, excluding those already present."""
+        seen = set(terms)
+        added = []
+        for term in terms:
+            for word in self.lookup(term):
+                if word not in seen:
+                    seen.add(word)
+                    added.append(word)
+        return added
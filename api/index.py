@@ -0,0 +1,244 @@
+"""In-memory indexes over an event snapshot, built once per scrape generation."""
+
+import heapq
+import math
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from eventstore import day_and_time
+from expansion import ExpansionTable
+from matrix import MatrixIndex
+from semantic import SemanticIndex
+from search import BM25_B, BM25_K1, FIELD_WEIGHTS, field_text
+
+GRAM = 3
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class TermIndex:
+    """Field → trigram → posting-set index that reproduces score_event() exactly.
+
+    A term of three or more characters can only occur in a field whose text
+    contains every trigram of the term, so intersecting the trigram postings
+    narrows the candidates and a final ``term in text`` check on those keeps
+    plain substring semantics. Shorter terms fall back to scanning the
+    precomputed field texts.
+
+    Field lengths (in words) and their averages are also kept for BM25F
+    ranking; document frequencies are memoized per term for the life of the
+    index, i.e. one scrape generation.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self.events = events
+        self.texts: Dict[str, List[Optional[str]]] = {f: [] for f in FIELD_WEIGHTS}
+        self.postings: Dict[str, Dict[str, Set[int]]] = {f: {} for f in FIELD_WEIGHTS}
+        self.lengths: Dict[str, List[int]] = {f: [] for f in FIELD_WEIGHTS}
+        self._df: Dict[str, int] = {}
+
+        for doc_id, event in enumerate(events):
+            for field in FIELD_WEIGHTS:
+                text = field_text(event, field)
+                self.texts[field].append(text)
+                self.lengths[field].append(len(_WORD.findall(text)) if text else 0)
+                if not text:
+                    continue
+                postings = self.postings[field]
+                for gram in _grams(text):
+                    bucket = postings.get(gram)
+                    if bucket is None:
+                        postings[gram] = {doc_id}
+                    else:
+                        bucket.add(doc_id)
+        self.avg_lengths = {
+            f: max(sum(lengths) / len(lengths), 1.0) if lengths else 1.0
+            for f, lengths in self.lengths.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def matches(self, field: str, term: str) -> Set[int]:
+        """Doc ids whose ``field`` text contains ``term`` as a substring."""
+        texts = self.texts[field]
+        if len(term) < GRAM:
+            return {i for i, text in enumerate(texts) if text is not None and term in text}
+
+        postings = self.postings[field]
+        buckets = []
+        for gram in _grams(term):
+            bucket = postings.get(gram)
+            if not bucket:
+                return set()
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        candidates = buckets[0].intersection(*buckets[1:])
+        return {i for i in candidates if term in texts[i]}
+
+    def scores(self, terms: List[str], ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """Weighted score per matching doc id, optionally restricted to ``ids``."""
+        allowed = None if ids is None else set(ids)
+        scores: Dict[int, int] = {}
+        # A term listed twice is counted twice, exactly like score_event().
+        for term, count in Counter(terms).items():
+            for field, weight in FIELD_WEIGHTS.items():
+                hits = self.matches(field, term)
+                if allowed is not None:
+                    hits &= allowed
+                for doc_id in hits:
+                    scores[doc_id] = scores.get(doc_id, 0) + weight * count
+        return scores
+
+    def bm25f_scores(self, terms: List[str], ids: Optional[Iterable[int]] = None) -> Dict[int, float]:
+        """BM25F score per matching doc id, with FIELD_WEIGHTS as field boosts.
+
+        Term frequency is the number of substring occurrences in each field,
+        length-normalized per field and boosted before saturation; a term's
+        document frequency counts docs matching it in any field.
+        """
+        allowed = None if ids is None else set(ids)
+        n = len(self.events)
+        scores: Dict[int, float] = {}
+        for term, count in Counter(terms).items():
+            hits = {field: self.matches(field, term) for field in FIELD_WEIGHTS}
+            df = self._df.get(term)
+            if df is None:
+                df = self._df[term] = len(set().union(*hits.values()))
+            if not df:
+                continue
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            tf: Dict[int, float] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                found = hits[field] if allowed is None else hits[field] & allowed
+                texts, lengths, avg = self.texts[field], self.lengths[field], self.avg_lengths[field]
+                for doc_id in found:
+                    norm = 1 - BM25_B + BM25_B * lengths[doc_id] / avg
+                    tf[doc_id] = tf.get(doc_id, 0.0) + weight * texts[doc_id].count(term) / norm
+            for doc_id, t in tf.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + count * idf * t / (BM25_K1 + t)
+        return scores
+
+    def search(
+        self,
+        terms: List[str],
+        top_n: int,
+        ids: Optional[Iterable[int]] = None,
+        ranking: str = "weighted",
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Score desc, ties in snapshot order. "weighted" matches search.search()."""
+        scores = self.bm25f_scores(terms, ids) if ranking == "bm25f" else self.scores(terms, ids)
+        ranked = heapq.nsmallest(top_n, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(score, self.events[doc_id]) for doc_id, score in ranked]
+
+
+def _time_key(t: time) -> int:
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+class DateIndex:
+    """Start times parsed once and sorted by calendar day, plus a time-of-day column.
+
+    Matches filter_by_date()/filter_by_time(): days and times are compared in
+    each event's own UTC offset, and events without a parseable start are
+    never returned.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self._set_rows(
+            (day, doc_id, micros)
+            for doc_id, (day, micros) in enumerate(day_and_time(e.get("start")) for e in events)
+        )
+
+    @classmethod
+    def from_columns(cls, days: Sequence[int], times: Sequence[int]) -> "DateIndex":
+        """Build from pre-parsed start columns (day ordinal, -1 if none; microsecond of day)."""
+        index = cls.__new__(cls)
+        index._set_rows(zip(days, range(len(days)), times))
+        return index
+
+    def _set_rows(self, rows: Iterable[Tuple[int, int, int]]) -> None:
+        rows = sorted(r for r in rows if r[0] >= 0)
+        self.days = [r[0] for r in rows]
+        self.ids = [r[1] for r in rows]
+        self.times = [r[2] for r in rows]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def filter(
+        self,
+        date_range: Optional[Tuple[date, date]] = None,
+        time_range: Optional[Tuple[Optional[time], Optional[time]]] = None,
+    ) -> List[int]:
+        """Doc ids inside the date and/or time window, in snapshot order."""
+        lo, hi = 0, len(self.ids)
+        if date_range:
+            lo = bisect_left(self.days, date_range[0].toordinal())
+            hi = max(lo, bisect_right(self.days, date_range[1].toordinal()))
+        ids = self.ids[lo:hi]
+
+        t_start, t_end = time_range if time_range else (None, None)
+        if t_start is not None or t_end is not None:
+            t_lo = _time_key(t_start) if t_start is not None else -1
+            t_hi = _time_key(t_end) if t_end is not None else 1 << 62
+            ids = [i for i, t in zip(ids, self.times[lo:hi]) if t_lo <= t <= t_hi]
+        return sorted(ids)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One scrape's events plus everything derived from them, swapped in as a unit.
+
+    ``complete`` is False for the partial batches published while a scrape is
+    still running. ``backend`` picks the term scorer: "index" (TermIndex) or
+    "matrix" (MatrixIndex, needs numpy); both give identical results.
+    ``semantic`` holds the LSA vectors behind /search?mode=semantic, and
+    ``expansions`` the local related-terms table, when enabled; api.py
+    builds both only for complete snapshots.
+    """
+
+    generation: int
+    events: List[Dict[str, Any]]
+    terms: Union[TermIndex, "MatrixIndex"]
+    dates: DateIndex
+    complete: bool = True
+    semantic: Optional[SemanticIndex] = None
+    expansions: Optional[ExpansionTable] = None
+
+    @classmethod
+    def build(
+        cls,
+        events: List[Dict[str, Any]],
+        generation: int,
+        complete: bool = True,
+        dates: Optional[DateIndex] = None,
+        backend: str = "index",
+        semantic: bool = False,
+        expansions: bool = False,
+    ) -> "Snapshot":
+        terms = MatrixIndex(events) if backend == "matrix" else TermIndex(events)
+        return cls(
+            generation,
+            events,
+            terms,
+            dates if dates is not None else DateIndex(events),
+            complete,
+            SemanticIndex(events) if semantic else None,
+            ExpansionTable(events) if expansions else None,
+        )
+
+    def local_expansion(self, terms: List[str]) -> List[str]:
+        """Related terms for a query the LLM did not expand; [] without a table.
+
+        /search and the CLI both expand through here, so a no-LLM query gets
+        the same terms from either.
+        """
+        return self.expansions.expand(terms) if self.expansions is not None else []
@@ -0,0 +1,185 @@
+"""Sparse field × term-document matrices: an optional NumPy scoring backend for TermIndex's rankings."""
+
+import math
+import re
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # SEARCH_BACKEND=matrix is unavailable
+    np = None
+
+from search import BM25_B, BM25_K1, FIELD_WEIGHTS, field_text
+
+_WORD = re.compile(r"[a-z0-9]+")
+_ALNUM = re.compile(r"[a-z0-9]+\Z")
+
+
+class MatrixIndex:
+    """Per field, a docs × vocabulary matrix of token counts, stored column-wise (CSC).
+
+    A query term made only of [a-z0-9] can't span two tokens, so it occurs in a
+    field exactly where some token containing it does, and its occurrence
+    count there is sum(count(term in token) × token count). Each (term, field)
+    is thus one sparse mat-vec: gather the columns of the matching vocabulary
+    entries and sum per doc. Other terms (phrases, punctuation) narrow their
+    candidates the same way via their alphanumeric runs, then check the
+    field text. Scores and order equal TermIndex.search() for both rankings;
+    top-k is taken with argpartition.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        if np is None:
+            raise RuntimeError("the matrix search backend needs numpy")
+        self.events = events
+        n = len(events)
+        vocab: Dict[str, int] = {}
+        cols = {f: array("i") for f in FIELD_WEIGHTS}
+        rows = {f: array("i") for f in FIELD_WEIGHTS}
+        counts = {f: array("i") for f in FIELD_WEIGHTS}
+        lengths = {f: array("i", bytes(4 * n)) for f in FIELD_WEIGHTS}
+
+        for doc_id, event in enumerate(events):
+            for field in FIELD_WEIGHTS:
+                text = field_text(event, field)
+                if not text:
+                    continue
+                tokens = _WORD.findall(text)
+                lengths[field][doc_id] = len(tokens)
+                for token, count in Counter(tokens).items():
+                    tid = vocab.get(token)
+                    if tid is None:
+                        tid = vocab[token] = len(vocab)
+                    cols[field].append(tid)
+                    rows[field].append(doc_id)
+                    counts[field].append(count)
+
+        self.vocab = list(vocab)
+        self._joined = "\n".join(self.vocab)
+        starts = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        if self.vocab:
+            starts[1:] = np.cumsum([len(t) + 1 for t in self.vocab])
+        self._token_starts = starts
+        self.indptr: Dict[str, "np.ndarray"] = {}
+        self.indices: Dict[str, "np.ndarray"] = {}
+        self.data: Dict[str, "np.ndarray"] = {}
+        self.norms: Dict[str, "np.ndarray"] = {}
+        for field in FIELD_WEIGHTS:
+            col = np.frombuffer(cols[field], dtype=np.int32)
+            order = np.argsort(col, kind="stable")
+            indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum(np.bincount(col, minlength=len(self.vocab)))
+            self.indptr[field] = indptr
+            self.indices[field] = np.frombuffer(rows[field], dtype=np.int32)[order]
+            self.data[field] = np.frombuffer(counts[field], dtype=np.int32)[order]
+            length = np.frombuffer(lengths[field], dtype=np.int32).astype(np.float64)
+            avg = max(length.sum() / n, 1.0) if n else 1.0
+            self.norms[field] = 1 - BM25_B + BM25_B * length / avg
+        self._vocab_hits: Dict[str, Tuple["np.ndarray", "np.ndarray"]] = {}
+        self._df: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def _matching_tokens(self, term: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Vocabulary ids containing ``term`` and how often each contains it."""
+        hit = self._vocab_hits.get(term)
+        if hit is None:
+            # Matches can't cross the "\n" separators, so a non-overlapping
+            # scan still finds every token containing the term.
+            positions = [m.start() for m in re.finditer(re.escape(term), self._joined)]
+            vids = np.unique(np.searchsorted(self._token_starts, positions, side="right") - 1)
+            occ = np.array([self.vocab[v].count(term) for v in vids], dtype=np.float64)
+            hit = self._vocab_hits[term] = (vids, occ)
+        return hit
+
+    def _gather(self, field: str, vids: "np.ndarray", weights: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Sparse mat-vec of the field matrix with ``weights`` on columns ``vids``:
+        (doc ids with a nonzero result, their sums)."""
+        indptr = self.indptr[field]
+        starts, ends = indptr[vids], indptr[vids + 1]
+        lens = ends - starts
+        total = int(lens.sum())
+        if not total:
+            return np.empty(0, dtype=np.int32), np.empty(0)
+        offsets = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(total)
+        docs, inverse = np.unique(self.indices[field][offsets], return_inverse=True)
+        sums = np.bincount(inverse, weights=self.data[field][offsets] * np.repeat(weights, lens))
+        return docs, sums
+
+    def term_frequencies(self, field: str, term: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Doc ids whose ``field`` contains ``term``, and the occurrence counts."""
+        if _ALNUM.match(term):
+            return self._gather(field, *self._matching_tokens(term))
+        runs = _WORD.findall(term)
+        candidates: Optional["np.ndarray"] = None
+        for run in runs:
+            docs, _ = self._gather(field, *self._matching_tokens(run))
+            candidates = docs if candidates is None else np.intersect1d(candidates, docs, assume_unique=True)
+        if candidates is None:
+            candidates = np.arange(len(self.events))
+        found, tf = [], []
+        for doc_id in candidates.tolist():
+            text = field_text(self.events[doc_id], field)
+            if text is not None and term in text:
+                found.append(doc_id)
+                tf.append(text.count(term))
+        return np.array(found, dtype=np.int32), np.array(tf, dtype=np.float64)
+
+    def scores(self, terms: List[str], ids: Optional[Iterable[int]] = None) -> "np.ndarray":
+        """TermIndex.scores() as a dense vector over doc ids."""
+        score = np.zeros(len(self.events), dtype=np.int64)
+        for term, count in Counter(terms).items():
+            for field, weight in FIELD_WEIGHTS.items():
+                docs, _ = self.term_frequencies(field, term)
+                score[docs] += weight * count
+        return self._restrict(score, ids)
+
+    def bm25f_scores(self, terms: List[str], ids: Optional[Iterable[int]] = None) -> "np.ndarray":
+        """TermIndex.bm25f_scores() as a dense vector over doc ids."""
+        n = len(self.events)
+        score = np.zeros(n)
+        for term, count in Counter(terms).items():
+            tf = np.zeros(n)
+            for field, weight in FIELD_WEIGHTS.items():
+                docs, freq = self.term_frequencies(field, term)
+                tf[docs] += weight * freq / self.norms[field][docs]
+            hit = np.flatnonzero(tf)
+            df = self._df.setdefault(term, len(hit))
+            if not df:
+                continue
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            score[hit] += count * idf * tf[hit] / (BM25_K1 + tf[hit])
+        return self._restrict(score, ids)
+
+    @staticmethod
+    def _restrict(score: "np.ndarray", ids: Optional[Iterable[int]]) -> "np.ndarray":
+        if ids is None:
+            return score
+        mask = np.zeros(len(score), dtype=bool)
+        mask[np.fromiter(ids, dtype=np.int64)] = True
+        score[~mask] = 0
+        return score
+
+    def search(
+        self,
+        terms: List[str],
+        top_n: int,
+        ids: Optional[Iterable[int]] = None,
+        ranking: str = "weighted",
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Same results as TermIndex.search(): score desc, ties in snapshot order."""
+        score = self.bm25f_scores(terms, ids) if ranking == "bm25f" else self.scores(terms, ids)
+        hits = np.flatnonzero(score > 0)
+        if top_n <= 0 or not len(hits):
+            return []
+        if len(hits) > top_n:
+            # Everything scoring at least the k-th best value, ties included,
+            # then an exact (score desc, doc id) sort of just those.
+            kth = score[hits][np.argpartition(-score[hits], top_n - 1)[top_n - 1]]
+            hits = hits[score[hits] >= kth]
+        order = hits[np.lexsort((hits, -score[hits]))][:top_n]
+        as_py = int if score.dtype.kind == "i" else float
+        return [(as_py(score[d]), self.events[d]) for d in order.tolist()]
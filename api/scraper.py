@@ -1,18 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import hashlib
 import html
 import json
 import os
+import random
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from datetime import datetime, date
-from typing import Iterable, List, Optional
-from urllib.parse import urljoin
+from functools import partial
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from metrics import Counter, Histogram
+
+# requests and bs4 are imported where they are used, so importing this module
+# (api.py does, for Event and the scrape entry points) doesn't load them.
 
 
 DEFAULT_BASE_URL = "https://events.unl.edu/"
@@ -41,8 +50,36 @@ def clean_text(value: Optional[str]) -> Optional[str]:
     return cleaned or None
 
 
+_session: Optional["requests.Session"] = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+
+def http_session(pool_size: int = 10) -> "requests.Session":
+    """Process-wide keep-alive session shared by every scraper entry point.
+
+    Each host gets a pool of at least ``pool_size`` connections (one per
+    enrichment worker), so detail-page fetches reuse TCP+TLS connections to
+    events.unl.edu instead of opening one per request.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _session, _session_pool_size
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers["User-Agent"] = USER_AGENT
+        if pool_size > _session_pool_size:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+            _session_pool_size = pool_size
+        return _session
+
+
 def fetch_html(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
-    response = requests.get(
+    response = http_session().get(
         url,
         headers={"User-Agent": USER_AGENT, "Accept": "text/html"},
         timeout=timeout,
@@ -85,86 +122,184 @@ def extract_group_from_description(text: str) -> Optional[str]:
 # RSS scraper — cleanest source, covers all upcoming events in one request
 # ---------------------------------------------------------------------------
 
-def scrape_rss(limit: int = -1, timeout: int = DEFAULT_TIMEOUT) -> List[Event]:
+RSS_CHUNK_SIZE = 64 * 1024
+
+
+def scrape_rss(
+    limit: int = -1,
+    timeout: int = DEFAULT_TIMEOUT,
+    base_url: str = DEFAULT_BASE_URL,
+) -> List[Event]:
     """Fetch all upcoming events via the RSS feed."""
-    url = f"https://events.unl.edu/upcoming/?format=rss&limit={limit}"
-    response = requests.get(
+    try:
+        return dedupe_events(iter_scrape_rss(limit, timeout, base_url))
+    except ET.ParseError:
+        return []
+
+
+def iter_scrape_rss(
+    limit: int = -1,
+    timeout: int = DEFAULT_TIMEOUT,
+    base_url: str = DEFAULT_BASE_URL,
+) -> Iterator[Event]:
+    """Stream the RSS feed, yielding each Event as its <item> arrives off the socket.
+
+    Raises ET.ParseError if the feed turns out to be malformed part-way through.
+    """
+    url = urljoin(base_url, f"upcoming/?format=rss&limit={limit}")
+    with http_session().get(
         url,
         headers={"User-Agent": USER_AGENT},
         timeout=timeout,
-    )
-    response.raise_for_status()
-    return parse_rss_events(response.text, url)
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        yield from iter_rss_events(response.iter_content(RSS_CHUNK_SIZE), url)
 
 
 def parse_rss_events(xml_text: str, source_url: str) -> List[Event]:
-    events: List[Event] = []
-
     try:
-        root = ET.fromstring(xml_text)
+        return dedupe_events(iter_rss_events([xml_text], source_url))
     except ET.ParseError:
-        return events
-
-    ns = {"content": "http://purl.org/rss/1.0/modules/content/"}
-    channel = root.find("channel")
-    if channel is None:
-        return events
-
-    for item in channel.findall("item"):
-        title_el = item.find("title")
-        link_el = item.find("link")
-        desc_el = item.find("description")
-
-        title = clean_text(title_el.text) if title_el is not None else None
-        if not title:
-            continue
+        return []
 
-        # links come as protocol-relative //events.unl.edu/...
-        raw_link = (link_el.text or "").strip() if link_el is not None else ""
-        event_url = raw_link if raw_link.startswith("http") else "https:" + raw_link
 
-        start = end = location = description = group = None
+def iter_rss_events(chunks: Iterable[Union[bytes, str]], source_url: str) -> Iterator[Event]:
+    """Incrementally parse RSS bytes, yielding an Event per rss/channel/item.
 
-        if desc_el is not None and desc_el.text:
-            desc_soup = BeautifulSoup(desc_el.text, "html.parser")
+    Each item is detached from the tree once converted, so memory stays flat
+    however long the feed is. Duplicates are not removed here.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    path: List[str] = []
+    channel = None
+
+    def drain() -> Iterator[Event]:
+        nonlocal channel
+        for kind, el in parser.read_events():
+            if kind == "start":
+                path.append(el.tag)
+                if len(path) == 2 and path[1] == "channel":
+                    channel = el
+                continue
+            path.pop()
+            if el.tag == "item" and len(path) == 2 and path[1] == "channel":
+                event = _rss_item_event(el, source_url)
+                channel.remove(el)
+                if event is not None:
+                    yield event
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def _rss_item_event(item: ET.Element, source_url: str) -> Optional[Event]:
+    title_el = item.find("title")
+    link_el = item.find("link")
+    desc_el = item.find("description")
+
+    title = clean_text(title_el.text) if title_el is not None else None
+    if not title:
+        return None
 
-            dtstart = desc_soup.find("abbr", class_="dtstart")
-            if dtstart:
-                start = clean_text(dtstart.get("title"))
+    # links come as protocol-relative //events.unl.edu/...
+    raw_link = (link_el.text or "").strip() if link_el is not None else ""
+    event_url = raw_link if raw_link.startswith("http") else "https:" + raw_link
+
+    start = end = location = description = group = None
+
+    if desc_el is not None and desc_el.text:
+        desc = _RssDescription(desc_el.text)
+        start = clean_text(desc.dtstart)
+        end = clean_text(desc.dtend)
+
+        # location is in a <small> that follows the time smalls
+        # typically: [date string, time string, location string]
+        if len(desc.smalls) >= 3:
+            location = clean_text(desc.smalls[2])
+        elif len(desc.smalls) == 2:
+            location = clean_text(desc.smalls[1])
+
+        # remaining text outside the small metadata tags is the description
+        group = extract_group_from_description(desc.text)
+        description = clean_text(desc.text)
+
+    return Event(
+        title=title,
+        url=event_url or source_url,
+        start=start,
+        end=end,
+        location=location,
+        description=description,
+        group=group,
+        source=source_url,
+    )
 
-            dtend = desc_soup.find("abbr", class_="dtend")
-            if dtend:
-                end = clean_text(dtend.get("title"))
 
-            # location is in a <small> that follows the time smalls
-            smalls = desc_soup.find_all("small")
-            # typically: [date string, time string, location string]
-            if len(smalls) >= 3:
-                location = clean_text(smalls[2].get_text())
-            elif len(smalls) == 2:
-                location = clean_text(smalls[1].get_text())
+class _RssDescription(HTMLParser):
+    """One pass over an RSS description's HTML without building a tree.
 
-            # strip the small metadata tags then grab remaining text as description
-            for tag in desc_soup.find_all("small"):
-                tag.decompose()
-            full_text = desc_soup.get_text()
-            group = extract_group_from_description(full_text)
-            description = clean_text(full_text)
+    Collects what parse_rss_events used to read from a BeautifulSoup tree: the
+    title of the first abbr.dtstart / abbr.dtend, the text of every <small>,
+    and the text left over once the smalls are removed.
+    """
 
-        events.append(
-            Event(
-                title=title,
-                url=event_url or source_url,
-                start=start,
-                end=end,
-                location=location,
-                description=description,
-                group=group,
-                source=source_url,
-            )
-        )
+    def __init__(self, markup: str):
+        super().__init__(convert_charrefs=True)
+        self.dtstart: Optional[str] = None
+        self.dtend: Optional[str] = None
+        self.smalls: List[str] = []
+        self._open_smalls: List[int] = []
+        self._text: List[str] = []
+        self._skip = 0
+        self.feed(markup)
+        self.close()
+
+    @property
+    def text(self) -> str:
+        return "".join(self._text)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "small":
+            self._open_smalls.append(len(self.smalls))
+            self.smalls.append("")
+        elif tag == "abbr":
+            attrs = dict(attrs)
+            classes = (attrs.get("class") or "").split()
+            if self.dtstart is None and "dtstart" in classes:
+                self.dtstart = attrs.get("title") or ""
+            if self.dtend is None and "dtend" in classes:
+                self.dtend = attrs.get("title") or ""
+        elif tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_startendtag(self, tag, attrs):
+        if tag != "small":
+            self.handle_starttag(tag, attrs)
+        else:
+            self.smalls.append("")
+
+    def handle_endtag(self, tag):
+        if tag == "small" and self._open_smalls:
+            self._open_smalls.pop()
+        elif tag in ("script", "style") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._open_smalls:
+            for i in self._open_smalls:
+                self.smalls[i] += data
+        else:
+            self._text.append(data)
 
-    return dedupe_events(events)
+    def unknown_decl(self, data):
+        if data.startswith("CDATA["):
+            self.handle_data(data[6:])
 
 
 # ---------------------------------------------------------------------------
@@ -186,6 +321,8 @@ def month_urls(start: date, end: date) -> List[str]:
 
 def scrape_month(url: str, timeout: int = DEFAULT_TIMEOUT) -> List[Event]:
     """Scrape a single monthly listing page."""
+    from bs4 import BeautifulSoup
+
     html = fetch_html(url, timeout=timeout)
     soup = BeautifulSoup(html, "html.parser")
 
@@ -221,6 +358,8 @@ def scrape_date_range(
     timeout: int = DEFAULT_TIMEOUT,
 ) -> List[Event]:
     """Scrape all events across a date range by iterating monthly pages."""
+    import requests
+
     all_events: List[Event] = []
     for url in month_urls(start, end):
         print(f"  Fetching {url} …")
@@ -235,7 +374,7 @@ def scrape_date_range(
 # JSON-LD + HTML parsers (kept from original)
 # ---------------------------------------------------------------------------
 
-def parse_events_from_jsonld(soup: BeautifulSoup, source_url: str) -> List[Event]:
+def parse_events_from_jsonld(soup: "BeautifulSoup", source_url: str) -> List[Event]:
     events: List[Event] = []
 
     for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
@@ -295,7 +434,7 @@ def parse_events_from_jsonld(soup: BeautifulSoup, source_url: str) -> List[Event
     return dedupe_events(events)
 
 
-def parse_events_from_html(soup: BeautifulSoup, source_url: str) -> List[Event]:
+def parse_events_from_html(soup: "BeautifulSoup", source_url: str) -> List[Event]:
     events: List[Event] = []
 
     selectors = [
@@ -376,6 +515,8 @@ def dedupe_events(events: Iterable[Event]) -> List[Event]:
 
 
 def scrape_events(url: str, timeout: int = DEFAULT_TIMEOUT) -> List[Event]:
+    from bs4 import BeautifulSoup
+
     html = fetch_html(url, timeout=timeout)
     soup = BeautifulSoup(html, "html.parser")
     jsonld_events = parse_events_from_jsonld(soup, url)
@@ -394,15 +535,24 @@ ENGAGE_EVENT_BASE = "https://unl.campuslabs.com/engage/event/"
 ENGAGE_SOURCE_URL = "https://unl.campuslabs.com/engage/events"
 
 
-def scrape_engage(timeout: int = DEFAULT_TIMEOUT) -> List[Event]:
-    """Page through the Campus Labs Engage API and return all upcoming public events."""
+ENGAGE_PAGE_SIZE = 100
+ENGAGE_CONCURRENCY = 8
+
+
+def scrape_engage(
+    timeout: int = DEFAULT_TIMEOUT,
+    api_url: str = ENGAGE_API,
+    concurrency: int = ENGAGE_CONCURRENCY,
+) -> List[Event]:
+    """Page through the Campus Labs Engage API and return all upcoming public events.
+
+    The first page reports @odata.count; the remaining pages are then fetched
+    ``concurrency`` at a time and assembled in their original order.
+    """
     today = date.today().isoformat()
-    events: List[Event] = []
-    skip = 0
-    take = 100
-    total: Optional[int] = None
+    take = ENGAGE_PAGE_SIZE
 
-    while total is None or skip < total:
+    def fetch_page(skip: int) -> Dict[str, Any]:
         params = {
             "endsAfter": today,
             "orderByField": "startsOn",
@@ -411,52 +561,89 @@ def scrape_engage(timeout: int = DEFAULT_TIMEOUT) -> List[Event]:
             "take": take,
             "skip": skip,
         }
-        response = requests.get(
-            ENGAGE_API,
+        response = http_session(concurrency).get(
+            api_url,
             params=params,
             headers={"User-Agent": USER_AGENT},
             timeout=timeout,
         )
         response.raise_for_status()
-        data = response.json()
+        return response.json()
 
-        if total is None:
-            total = data.get("@odata.count", 0)
+    first = fetch_page(0)
+    total = first.get("@odata.count", 0)
+    pages = [first]
+    if first.get("value") and total > take:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            pages.extend(pool.map(fetch_page, range(take, total, take)))
 
+    events: List[Event] = []
+    for page_no, data in enumerate(pages):
         items = data.get("value") or []
         if not items:
             break
+        events.extend(_engage_event(item) for item in items)
+        print(f"  Fetched {min((page_no + 1) * take, total)}/{total} Engage events …")
 
-        for item in items:
-            desc_html = item.get("description") or ""
-            desc = clean_text(BeautifulSoup(desc_html, "html.parser").get_text()) if desc_html else None
+    return dedupe_events(events)
 
-            img_path = item.get("imagePath")
-            image_url = (ENGAGE_IMAGE_BASE + img_path) if img_path else None
 
-            event_id = item.get("id")
-            event_url = f"{ENGAGE_EVENT_BASE}{event_id}" if event_id else ENGAGE_SOURCE_URL
+def _engage_event(item: Dict[str, Any]) -> Event:
+    desc_html = item.get("description") or ""
+    desc = clean_text(html_text(desc_html)) if desc_html else None
 
-            category_names = [c for c in (item.get("categoryNames") or []) if c]
-            audience = category_names if category_names else None
+    img_path = item.get("imagePath")
+    image_url = (ENGAGE_IMAGE_BASE + img_path) if img_path else None
 
-            events.append(Event(
-                title=clean_text(item.get("name") or "") or "",
-                url=event_url,
-                start=item.get("startsOn"),
-                end=item.get("endsOn"),
-                location=clean_text(item.get("location")),
-                description=desc,
-                group=clean_text(item.get("organizationName")),
-                image_url=image_url,
-                audience=audience,
-                source=ENGAGE_SOURCE_URL,
-            ))
+    event_id = item.get("id")
+    event_url = f"{ENGAGE_EVENT_BASE}{event_id}" if event_id else ENGAGE_SOURCE_URL
 
-        skip += take
-        print(f"  Fetched {min(skip, total)}/{total} Engage events …")
+    category_names = [c for c in (item.get("categoryNames") or []) if c]
+    audience = category_names if category_names else None
 
-    return dedupe_events(events)
+    return Event(
+        title=clean_text(item.get("name") or "") or "",
+        url=event_url,
+        start=item.get("startsOn"),
+        end=item.get("endsOn"),
+        location=clean_text(item.get("location")),
+        description=desc,
+        group=clean_text(item.get("organizationName")),
+        image_url=image_url,
+        audience=audience,
+        source=ENGAGE_SOURCE_URL,
+    )
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA["):
+            self.handle_data(data[6:])
+
+
+def html_text(markup: str) -> str:
+    """BeautifulSoup(markup, "html.parser").get_text(), without building the tree."""
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return "".join(extractor.parts)
 
 
 def _norm_title(title: str) -> str:
@@ -480,60 +667,281 @@ def cross_dedupe(primary: List[Event], secondary: List[Event]) -> List[Event]:
 # Per-event enrichment — fetches each detail page for image, group, audience
 # ---------------------------------------------------------------------------
 
+ENRICH_SECONDS = Histogram(
+    "scraper_enrich_seconds",
+    "Per-URL detail page time: fetch (one HTTP attempt) or parse.",
+    ("engine", "stage"),
+)
+ENRICH_ERRORS = Counter(
+    "scraper_enrich_errors_total",
+    "Detail pages left unenriched because the fetch or the parse failed.",
+    ("engine", "stage"),
+)
+ENRICH_RETRIES = Counter("scraper_enrich_retries_total", "Detail page fetches retried (async engine).")
+
+
 def enrich_event(event: Event, timeout: int = DEFAULT_TIMEOUT) -> Event:
     """Visit an event's detail page and fill in image_url, group, and audience."""
     try:
-        page_html = fetch_html(event.url, timeout=timeout)
-        soup = BeautifulSoup(page_html, "html.parser")
-
-        # Image from JSON-LD ("image" field)
-        if not event.image_url:
-            for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
-                if not tag.string:
-                    continue
-                try:
-                    data = json.loads(tag.string.strip())
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(data, dict) and data.get("@type") == "Event":
-                    img_data = data.get("image")
-                    img = img_data[0] if isinstance(img_data, list) and img_data else (
-                        img_data if isinstance(img_data, str) else None
-                    )
-                    if img:
-                        img = html.unescape(img)
-                        event.image_url = "https:" + img if img.startswith("//") else img
-                    break
+        with ENRICH_SECONDS.time(engine="threads", stage="fetch"):
+            page_html = fetch_html(event.url, timeout=timeout)
+    except Exception:
+        ENRICH_ERRORS.inc(engine="threads", stage="fetch")
+        return event
+    try:
+        with ENRICH_SECONDS.time(engine="threads", stage="parse"):
+            apply_detail_page(event, page_html)
+    except Exception:
+        ENRICH_ERRORS.inc(engine="threads", stage="parse")
+    return event
 
-        # Group from "This event originated in [link]" text
-        if not event.group:
-            for node in soup.find_all(string=re.compile(r"originated in", re.I)):
-                parent = node.parent
-                if parent:
-                    link = parent.find("a")
-                    if link:
-                        event.group = clean_text(link.get_text())
-                        break
-
-        # Audience from links like //events.unl.edu/audience/?audience=Public
-        audience_links = soup.find_all("a", href=re.compile(r"audience="))
-        if audience_links:
-            event.audience = [
-                clean_text(a.get_text()) for a in audience_links
-                if clean_text(a.get_text())
-            ]
 
+# Detail pages are parsed either fully (parse_detail_page) or by scanning the
+# raw HTML for just the three regions enrichment needs (scan_detail_page).
+_ORIGINATED_RE = re.compile(r"originated in", re.I)
+_LD_JSON_RE = re.compile(
+    r"<script\b[^>]*?\btype=([\"'])(?-i:application/ld\+json)\1[^>]*>(.*?)</script\s*>", re.I | re.S
+)
+_ANCHOR_RE = re.compile(r"<a\b([^>]*)>(.*?)</a\s*>", re.I | re.S)
+_HREF_RE = re.compile(r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_MARKUP_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>|<(/?)([a-zA-Z][\w:-]*)\b[^>]*?(/?)>|<![^>]*>",
+    re.I | re.S,
+)
+# Comments and script/style elements: html.parser yields no tags inside them.
+_HIDDEN_RE = re.compile(r"<!--.*?-->|<(script|style)\b([^>]*)>(.*?)</\1\s*>", re.I | re.S)
+_LD_JSON_TYPE_RE = re.compile(r"""\btype=(["'])(?-i:application/ld\+json)\1""", re.I)
+_TAG_RE = re.compile(r"<[^>]*>")
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+
+DetailFields = Tuple[Optional[str], Optional[str], Optional[List[str]]]
+
+
+def apply_detail_page(event: Event, page_html: str) -> Event:
+    """Fill in image_url, group, and audience from a fetched detail page."""
+    try:
+        fields = scan_detail_page(page_html)
     except Exception:
-        pass
+        fields = None
+    if fields is None:
+        fields = parse_detail_page(page_html)
+    image_url, group, audience = fields
+    if not event.image_url and image_url:
+        event.image_url = image_url
+    if not event.group and group:
+        event.group = group
+    if audience is not None:
+        event.audience = audience
     return event
 
 
+def _ld_json_image(raw: str) -> Tuple[bool, Optional[str]]:
+    """(is an Event node, image URL) for one ld+json script body."""
+    try:
+        data = json.loads(raw.strip())
+    except json.JSONDecodeError:
+        return False, None
+    if not (isinstance(data, dict) and data.get("@type") == "Event"):
+        return False, None
+    img_data = data.get("image")
+    img = img_data[0] if isinstance(img_data, list) and img_data else (
+        img_data if isinstance(img_data, str) else None
+    )
+    if img:
+        img = html.unescape(img)
+        img = "https:" + img if img.startswith("//") else img
+    return True, img
+
+
+def parse_detail_page(page_html: str) -> DetailFields:
+    """Extract (image_url, group, audience) from a full BeautifulSoup tree."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page_html, "html.parser")
+    image_url = group = audience = None
+
+    # Image from JSON-LD ("image" field)
+    for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        if not tag.string:
+            continue
+        is_event, image_url = _ld_json_image(tag.string)
+        if is_event:
+            break
+
+    # Group from "This event originated in [link]" text
+    for node in soup.find_all(string=_ORIGINATED_RE):
+        parent = node.parent
+        if parent:
+            link = parent.find("a")
+            if link:
+                group = clean_text(link.get_text())
+                break
+
+    # Audience from links like //events.unl.edu/audience/?audience=Public
+    audience_links = soup.find_all("a", href=re.compile(r"audience="))
+    if audience_links:
+        audience = [
+            clean_text(a.get_text()) for a in audience_links
+            if clean_text(a.get_text())
+        ]
+    return image_url, group, audience
+
+
+def _element_around(page_html: str, pos: int) -> Optional[Tuple[int, int]]:
+    """Span of the innermost element whose text contains ``pos``.
+
+    Walks the markup backwards from ``pos`` through a window that widens until
+    an unclosed opening tag is found. Returns None when ``pos`` sits inside
+    markup (a tag, comment or script), or when the element's boundaries
+    can't be determined.
+    """
+    window = 2048
+    while True:
+        lo = max(0, pos - window)
+        if lo:
+            # Start right after a tag, and never inside a comment or script block.
+            lo = page_html.find(">", lo, pos) + 1
+            head = page_html[lo:pos].lower()
+            if not lo or any(
+                0 <= head.find(close) < (head.find(opener) if opener in head else len(head))
+                for opener, close in (("<!--", "-->"), ("<script", "</script"), ("<style", "</style"))
+            ):
+                window *= 4
+                continue
+
+        tokens = []
+        for m in _MARKUP_RE.finditer(page_html, lo):
+            if m.end() > pos:
+                if m.start() < pos:
+                    return None
+                break
+            tokens.append(m)
+
+        pending: Dict[str, int] = {}
+        parent = None
+        for m in reversed(tokens):
+            closing, name, self_closing = m.group(2), m.group(3), m.group(4)
+            if not name or m.group(1):
+                continue
+            name = name.lower()
+            if closing:
+                pending[name] = pending.get(name, 0) + 1
+            elif self_closing or name in _VOID_TAGS:
+                continue
+            elif pending.get(name):
+                pending[name] -= 1
+            else:
+                parent = (name, m.start())
+                break
+        if parent is not None:
+            break
+        if lo == 0:
+            return None
+        window *= 4
+
+    parent_name, start = parent
+    depth = 0
+    for m in _MARKUP_RE.finditer(page_html, pos):
+        closing, name, self_closing = m.group(2), m.group(3), m.group(4)
+        if not name or m.group(1) or name.lower() != parent_name:
+            continue
+        if not closing:
+            depth += 0 if self_closing else 1
+        elif depth:
+            depth -= 1
+        else:
+            return start, m.end()
+    return None
+
+
+def _blank_hidden(page_html: str) -> Tuple[str, List[Tuple[int, int]]]:
+    """``page_html`` with comments and script/style bodies replaced by spaces,
+    except ld+json script bodies, plus the spans of those kept bodies.
+
+    Offsets are unchanged, so a kept span can be blanked later by slicing.
+    """
+    kept: List[Tuple[int, int]] = []
+
+    def blank(m: "re.Match[str]") -> str:
+        if m.group(1) is None:
+            return " " * len(m.group(0))
+        if _LD_JSON_TYPE_RE.search(m.group(2)):
+            kept.append(m.span(3))
+            return m.group(0)
+        start, end = m.start(3) - m.start(), m.end(3) - m.start()
+        return m.group(0)[:start] + " " * (end - start) + m.group(0)[end:]
+
+    return _HIDDEN_RE.sub(blank, page_html), kept
+
+
+def _anchor_text(inner_html: str) -> Optional[str]:
+    return clean_text(html.unescape(_TAG_RE.sub("", inner_html)))
+
+
+def scan_detail_page(page_html: str) -> Optional[DetailFields]:
+    """Same result as parse_detail_page() without building the full tree.
+
+    Returns None when the page has signs of a field (an ld+json type, an
+    ``audience=`` link, "originated in" text) that the scan couldn't account
+    for; the caller then falls back to the full parse.
+    """
+    image_url = group = audience = None
+    # Match scripts and anchors only where the full parse sees tags.
+    with_ld_json, ld_json_spans = _blank_hidden(page_html)
+
+    found_ld_json = False
+    for m in _LD_JSON_RE.finditer(with_ld_json):
+        found_ld_json = True
+        if not m.group(2).strip():
+            continue
+        is_event, image_url = _ld_json_image(m.group(2))
+        if is_event:
+            break
+    if not found_ld_json and "application/ld+json" in with_ld_json:
+        return None
+
+    for m in _ORIGINATED_RE.finditer(page_html):
+        span = _element_around(page_html, m.start())
+        if span is None:
+            if page_html.rfind("<", 0, m.start()) > page_html.rfind(">", 0, m.start()):
+                continue  # inside a tag's attributes, which the full parse ignores too
+            return None
+        from bs4 import BeautifulSoup
+
+        region = BeautifulSoup(page_html[span[0]:span[1]], "html.parser")
+        node = region.find(string=_ORIGINATED_RE)
+        link = node.parent.find("a") if node is not None and node.parent else None
+        if link:
+            group = clean_text(link.get_text())
+            break
+
+    visible = with_ld_json
+    for start, end in ld_json_spans:
+        visible = visible[:start] + " " * (end - start) + visible[end:]
+    links = []
+    for m in _ANCHOR_RE.finditer(visible):
+        href = _HREF_RE.search(m.group(1))
+        if href and "audience=" in html.unescape(next(g for g in href.groups() if g is not None)):
+            links.append(_anchor_text(m.group(2)))
+    if links:
+        audience = [text for text in links if text]
+    elif "audience=" in visible:
+        return None
+
+    return image_url, group, audience
+
+
 def enrich_events(
     events: List[Event],
     timeout: int = DEFAULT_TIMEOUT,
     workers: int = 10,
 ) -> List[Event]:
     """Parallel-fetch each event detail page to fill in image, group, and audience."""
+    http_session(workers)
     total = len(events)
     result: List[Optional[Event]] = [None] * total
     with ThreadPoolExecutor(max_workers=workers) as executor:
@@ -551,6 +959,218 @@ def enrich_events(
     return [e for e in result if e is not None]
 
 
+# ---------------------------------------------------------------------------
+# asyncio enrichment — many fetches in flight, rate-limited per host
+# ---------------------------------------------------------------------------
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_RATE = 50.0
+DEFAULT_RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` acquisitions per second, bursts of up to ``burst``.
+
+    A rate of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+async def enrich_events_async(
+    events: List[Event],
+    timeout: int = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = 0.5,
+) -> List[Event]:
+    """asyncio counterpart of enrich_events().
+
+    Up to ``concurrency`` detail pages per host are in flight at once, each
+    host is held to ``rate`` requests per second, and connection errors and
+    429/5xx responses are retried up to ``retries`` times with jittered
+    exponential backoff (honouring a numeric Retry-After). Events whose page
+    can't be fetched are returned unenriched, as with enrich_events().
+    """
+    import aiohttp
+
+    total = len(events)
+    slots: Dict[str, asyncio.Semaphore] = {}
+    buckets: Dict[str, TokenBucket] = {}
+    done = 0
+
+    async def fetch(session: "aiohttp.ClientSession", url: str) -> Optional[str]:
+        host = urlparse(url).netloc
+        if host not in slots:
+            slots[host] = asyncio.Semaphore(concurrency)
+            buckets[host] = TokenBucket(rate)
+        for attempt in range(retries + 1):
+            delay = backoff * (2 ** attempt) * (0.5 + random.random())
+            async with slots[host]:
+                await buckets[host].acquire()
+                try:
+                    with ENRICH_SECONDS.time(engine="async", stage="fetch"):
+                        async with session.get(url) as response:
+                            if response.status < 400:
+                                return await response.text()
+                            if response.status not in RETRY_STATUSES:
+                                return None
+                            retry_after = response.headers.get("Retry-After", "")
+                            if retry_after.isdigit():
+                                delay = max(delay, float(retry_after))
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    pass
+            if attempt < retries:
+                ENRICH_RETRIES.inc()
+                await asyncio.sleep(delay)
+        return None
+
+    async def enrich_one(session: "aiohttp.ClientSession", event: Event) -> None:
+        nonlocal done
+        page_html = await fetch(session, event.url)
+        if page_html is None:
+            ENRICH_ERRORS.inc(engine="async", stage="fetch")
+        else:
+            try:
+                # Parsing is CPU-bound; keep the loop free to drive sockets.
+                await asyncio.to_thread(_timed_parse, event, page_html)
+            except Exception:
+                ENRICH_ERRORS.inc(engine="async", stage="parse")
+        done += 1
+        if done % 50 == 0 or done == total:
+            print(f"  Enriched {done}/{total} events …")
+
+    async with aiohttp.ClientSession(
+        headers={"User-Agent": USER_AGENT, "Accept": "text/html"},
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=aiohttp.TCPConnector(limit=0, limit_per_host=concurrency),
+    ) as session:
+        await asyncio.gather(*(enrich_one(session, e) for e in events))
+    return events
+
+
+def _timed_parse(event: Event, page_html: str) -> Event:
+    with ENRICH_SECONDS.time(engine="async", stage="parse"):
+        return apply_detail_page(event, page_html)
+
+
+def enrich_events_concurrent(
+    events: List[Event],
+    timeout: int = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    retries: int = DEFAULT_RETRIES,
+) -> List[Event]:
+    """Blocking wrapper around enrich_events_async() for threads without a running loop."""
+    return asyncio.run(enrich_events_async(
+        events, timeout=timeout, concurrency=concurrency, rate=rate, retries=retries,
+    ))
+
+
+def event_fingerprint(event: Union[Event, Dict[str, Any]]) -> str:
+    """Hash of the listing fields that enrichment never touches.
+
+    Works on Event objects and on the dicts saved in events.json, so a fresh
+    RSS item can be compared with the enriched copy from the last scrape.
+    """
+    data = asdict(event) if isinstance(event, Event) else event
+    raw = json.dumps(
+        [data.get(f) for f in ("title", "start", "end", "location", "description")],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def enrich_events_incremental(
+    events: List[Event],
+    previous: Iterable[Union[Event, Dict[str, Any]]],
+    timeout: int = DEFAULT_TIMEOUT,
+    workers: int = 10,
+    enrich: Optional[Callable[[List[Event]], List[Event]]] = None,
+) -> Tuple[List[Event], Dict[str, int]]:
+    """enrich_events(), but only for events that are new or changed since ``previous``.
+
+    An event is unchanged when the previous scrape has the same URL and
+    fingerprint; its image, group and audience are copied over instead of
+    refetching the detail page. Previous events with neither an image nor an
+    audience are refetched, since that usually means their fetch failed.
+    Returns the events plus counts of detail pages fetched and skipped.
+    """
+    if enrich is None:
+        enrich = partial(enrich_events, timeout=timeout, workers=workers)
+    stats: Dict[str, int] = {}
+    for stats in iter_enrich_incremental(events, previous, enrich, batch_size=max(1, len(events))):
+        pass
+    return events, stats
+
+
+def iter_enrich_incremental(
+    events: List[Event],
+    previous: Iterable[Union[Event, Dict[str, Any]]],
+    enrich: Callable[[List[Event]], List[Event]],
+    batch_size: int = 250,
+) -> Iterator[Dict[str, int]]:
+    """enrich_events_incremental() one batch at a time.
+
+    Yields the stats once unchanged events have their fields copied over, and
+    again after each batch of ``batch_size`` detail fetches, with ``pending``
+    counting down to 0. ``events`` is updated in place, so callers can publish
+    it between steps.
+    """
+    prior: Dict[str, Dict[str, Any]] = {}
+    for old in previous:
+        data = asdict(old) if isinstance(old, Event) else old
+        if data.get("url") and (data.get("image_url") or data.get("audience")):
+            prior[data["url"]] = data
+
+    stale: List[Event] = []
+    for event in events:
+        old = prior.get(event.url)
+        if old is None or event_fingerprint(old) != event_fingerprint(event):
+            stale.append(event)
+            continue
+        if not event.image_url:
+            event.image_url = old.get("image_url")
+        if not event.group:
+            event.group = old.get("group")
+        event.audience = old.get("audience")
+
+    stats = {
+        "total": len(events),
+        "fetched": len(stale),
+        "skipped": len(events) - len(stale),
+        "pending": len(stale),
+    }
+    print(f"  Incremental enrichment: {stats['fetched']} new/changed, "
+          f"{stats['skipped']} unchanged (detail fetches skipped)")
+    yield stats
+    for i in range(0, len(stale), batch_size):
+        batch = stale[i:i + batch_size]
+        enrich(batch)
+        stats["pending"] -= len(batch)
+        yield stats
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -599,6 +1219,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip visiting individual event pages (skips image, group, and audience).",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse enrichment from the existing --output file for unchanged events.",
+    )
     parser.add_argument(
         "--no-engage",
         action="store_true",
@@ -611,10 +1236,32 @@ def parse_args() -> argparse.Namespace:
         metavar="N",
         help="Number of parallel workers for enrichment (default: 10).",
     )
+    parser.add_argument(
+        "--async",
+        action="store_true",
+        dest="use_async",
+        help="Enrich with the asyncio engine instead of a thread pool.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        metavar="N",
+        help=f"With --async: max in-flight fetches per host (default: {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        metavar="R",
+        help=f"With --async: max requests per second per host, 0 = unlimited (default: {DEFAULT_RATE:g}).",
+    )
     return parser.parse_args()
 
 
 def main() -> int:
+    import requests
+
     args = parse_args()
 
     try:
@@ -644,8 +1291,24 @@ def main() -> int:
         return 1
 
     if not args.no_enrich:
-        print(f"Enriching {len(events)} events (image, group, audience) with {args.workers} workers …")
-        events = enrich_events(events, timeout=args.timeout, workers=args.workers)
+        if args.use_async:
+            print(f"Enriching {len(events)} events (image, group, audience) asynchronously "
+                  f"({args.concurrency} in flight, {args.rate:g} req/s) …")
+            enrich = partial(
+                enrich_events_concurrent,
+                timeout=args.timeout, concurrency=args.concurrency, rate=args.rate,
+            )
+        else:
+            print(f"Enriching {len(events)} events (image, group, audience) with {args.workers} workers …")
+            enrich = partial(enrich_events, timeout=args.timeout, workers=args.workers)
+        previous = []
+        if args.incremental and os.path.exists(args.output):
+            with open(args.output, encoding="utf-8") as file:
+                previous = json.load(file).get("events") or []
+        if previous:
+            events, _ = enrich_events_incremental(events, previous, enrich=enrich)
+        else:
+            events = enrich(events)
 
     if not args.no_engage:
         try:
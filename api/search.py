@@ -2,20 +2,33 @@
 """Search scraped UNL events by keyword, with optional Gemini keyword expansion and date filtering."""
 
 import argparse
+import asyncio
 import json
+import logging
 import os
 import re
 import sys
-from datetime import datetime, timedelta, date, time
+import threading
+from datetime import datetime, date, time
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-from google import genai
+from cache import PersistentLRUCache
+from eventstore import read_events
+from timephrases import resolve as resolve_when, strip as strip_when
+
+log = logging.getLogger(__name__)
 
 EVENTS_FILE = "scraped/events.json"
 DEFAULT_TOP_N = 10
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
 DEFAULT_MODEL = os.environ.get("GEMINI_MODEL", "gemma-3-27b-it")
+# Gemini expansions are cached per (model, normalized query, today); set
+# LLM_CACHE_FILE to "" to keep the cache in memory only.
+LLM_CACHE_FILE = os.environ.get("LLM_CACHE_FILE", "scraped/llm_cache.sqlite3")
+LLM_CACHE_SIZE = int(os.environ.get("LLM_CACHE_SIZE", "1024"))
+LLM_CACHE_TTL = int(os.environ.get("LLM_CACHE_TTL", "21600"))
+LLM_TIMEOUT = float(os.environ.get("LLM_TIMEOUT", "10"))
+LLM_CONCURRENCY = int(os.environ.get("LLM_CONCURRENCY", "8"))
 
 FIELD_WEIGHTS = {
     "title":       4,
@@ -25,6 +38,18 @@ FIELD_WEIGHTS = {
     "audience":    1,
 }
 
+# "weighted" sums FIELD_WEIGHTS per substring hit (score_event); "bm25f" uses
+# them as field boosts in BM25F, so rare terms outrank common ones.
+RANKINGS = ("weighted", "bm25f")
+# "keyword" scores literal terms (plus any Gemini expansion); "semantic" ranks
+# by cosine similarity of local LSA vectors and never calls the LLM.
+SEARCH_MODES = ("keyword", "semantic")
+# Expand base terms from a corpus-derived related-terms table whenever no LLM
+# expansion is used (no_llm, no API key, or a failed call), in /search and the CLI.
+LOCAL_EXPANSION = os.environ.get("LOCAL_EXPANSION", "1") == "1"
+BM25_K1 = 1.2
+BM25_B = 0.75
+
 STOP_WORDS = {
     "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "is", "are", "was", "be", "i", "me", "my", "this",
@@ -83,86 +108,230 @@ JSON: {{"keywords": ["keyword1", "keyword2", ...], "date_from": "YYYY-MM-DD or n
 
 
 def load_events(path: str) -> List[Dict[str, Any]]:
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)["events"]
+    """Events from an events.json payload or a columnar eventstore file."""
+    return read_events(path)["events"]
 
 
 def base_terms(query: str) -> List[str]:
-    """Split query into meaningful words, stripping stop words."""
-    words = re.findall(r"[a-zA-Z0-9]+", query.lower())
+    """Split query into meaningful words, stripping stop words and date/time phrases."""
+    words = re.findall(r"[a-zA-Z0-9]+", strip_when(query))
     return [w for w in words if w not in STOP_WORDS and len(w) > 1]
 
 
-def expand_with_gemini(query: str, model: str) -> Tuple[Optional[List[str]], Optional[Tuple[date, date]], Optional[Tuple[Optional[time], Optional[time]]]]:
+Expansion = Tuple[
+    Optional[List[str]],
+    Optional[Tuple[date, date]],
+    Optional[Tuple[Optional[time], Optional[time]]],
+]
+
+_expansion_cache: Optional[PersistentLRUCache] = None
+_gemini_client: Optional["genai.Client"] = None
+_llm_slots: Optional[asyncio.Semaphore] = None
+# Guards first construction of the cache and client, which may race between
+# warm_llm() in a worker thread and the first requests.
+_llm_init_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _encode_expansion(value: Expansion) -> Dict[str, Any]:
+    keywords, date_range, time_range = value
+    return {
+        "keywords": keywords,
+        "date_range": [d.isoformat() for d in date_range] if date_range else None,
+        "time_range": [t.isoformat() if t else None for t in time_range] if time_range else None,
+    }
+
+
+def _decode_expansion(data: Dict[str, Any]) -> Expansion:
+    dr = data.get("date_range")
+    tr = data.get("time_range")
+    return (
+        data["keywords"],
+        (date.fromisoformat(dr[0]), date.fromisoformat(dr[1])) if dr else None,
+        tuple(time.fromisoformat(t) if t else None for t in tr) if tr else None,
+    )
+
+
+def expansion_cache() -> PersistentLRUCache:
+    """Process-wide Gemini expansion cache, opened on first use."""
+    global _expansion_cache
+    with _llm_init_lock:
+        if _expansion_cache is None:
+            _expansion_cache = PersistentLRUCache(
+                LLM_CACHE_FILE,
+                maxsize=LLM_CACHE_SIZE,
+                ttl=LLM_CACHE_TTL,
+                encode=_encode_expansion,
+                decode=_decode_expansion,
+            )
+    return _expansion_cache
+
+
+def warm_llm() -> None:
+    """Open expansion_cache() and, with an API key, build gemini_client().
+
+    Both block: the SQLite file is read in, and google.genai takes about a
+    second to import. The API runs this in a worker thread at startup so
+    neither lands on the event loop.
+    """
+    expansion_cache()
+    if GEMINI_API_KEY:
+        gemini_client()
+
+
+def expand_with_gemini(query: str, model: str) -> Expansion:
     """Call Gemini API to extract/expand keywords and resolve date/time references.
-    Returns (keywords, date_range, time_range) — any can be None if unavailable."""
+    Returns (keywords, date_range, time_range) — any can be None if unavailable.
+
+    Successful expansions are served from expansion_cache() for the rest of the day."""
     if not GEMINI_API_KEY:
         return None, None, None
+    cache = expansion_cache()
+    key = _expansion_key(query, model)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        now = datetime.now()
-        prompt = EXPAND_PROMPT.format(
-            now=now.strftime("%Y-%m-%d %H:%M"),
-            weekday=now.strftime("%A"),
-            query=query,
-        )
-        client = genai.Client(api_key=GEMINI_API_KEY)
-        response = client.models.generate_content(
+        response = gemini_client().models.generate_content(
             model=model,
-            contents=prompt,
+            contents=_expand_prompt(query),
         )
-        # Strip markdown code fences if model wraps response
-        text = response.text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
-        data = json.loads(text)
-        keywords = [str(k).lower() for k in (data.get("keywords") or []) if k]
-
-        date_range = None
-        df = data.get("date_from")
-        dt = data.get("date_to")
-        if df and df != "null":
-            try:
-                start = date.fromisoformat(str(df))
-                end = date.fromisoformat(str(dt)) if dt and dt != "null" else start
-                date_range = (start, end)
-            except ValueError:
-                pass
-
-        time_range = None
-        tf = data.get("time_from")
-        tt = data.get("time_to")
-        if (tf and tf != "null") or (tt and tt != "null"):
-            try:
-                t_start = time.fromisoformat(str(tf)) if tf and tf != "null" else None
-                t_end   = time.fromisoformat(str(tt)) if tt and tt != "null" else None
-                time_range = (t_start, t_end)
-            except ValueError:
-                pass
-
-        return keywords, date_range, time_range
+        result = _parse_expansion(response.text)
     except Exception as exc:
-        import logging
-        logging.getLogger(__name__).warning("expand_with_gemini failed: %s", exc)
+        log.warning("expand_with_gemini failed: %s", exc)
+        return None, None, None
+    cache.put(key, result)
+    return result
+
+
+async def expand_with_gemini_async(query: str, model: str) -> Expansion:
+    """Non-blocking expand_with_gemini() for the API's event loop.
+
+    Shares the cache and client with the sync path. At most LLM_CONCURRENCY
+    calls are in flight per process, and each call (including the wait for a
+    slot) is abandoned after LLM_TIMEOUT seconds so a slow model degrades to
+    base terms instead of holding the request."""
+    global _llm_slots
+    if not GEMINI_API_KEY:
         return None, None, None
+    # Built off the loop if a request beats warm_llm() to them.
+    # An empty cache is falsy (it has __len__), so test for None.
+    cache = _expansion_cache if _expansion_cache is not None else await asyncio.to_thread(expansion_cache)
+    key = _expansion_key(query, model)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    if _llm_slots is None:
+        _llm_slots = asyncio.Semaphore(LLM_CONCURRENCY)
+
+    async def call() -> str:
+        async with _llm_slots:
+            client = _gemini_client if _gemini_client is not None else await asyncio.to_thread(gemini_client)
+            response = await client.aio.models.generate_content(
+                model=model,
+                contents=_expand_prompt(query),
+            )
+            return response.text
+
+    try:
+        text = await asyncio.wait_for(call(), timeout=LLM_TIMEOUT)
+        result = _parse_expansion(text)
+    except asyncio.TimeoutError:
+        log.warning("expand_with_gemini timed out after %ss", LLM_TIMEOUT)
+        return None, None, None
+    except Exception as exc:
+        log.warning("expand_with_gemini failed: %s", exc)
+        return None, None, None
+    # A write-through to SQLite; keep it off the loop too.
+    await asyncio.to_thread(cache.put, key, result)
+    return result
+
+
+def gemini_client() -> "genai.Client":
+    """One Gemini client per process; it keeps its HTTP connections open between calls."""
+    global _gemini_client
+    with _llm_init_lock:
+        if _gemini_client is None:
+            # google.genai costs about a second to import; --no-llm and semantic
+            # mode never get here.
+            from google import genai
+
+            _gemini_client = genai.Client(api_key=GEMINI_API_KEY)
+    return _gemini_client
+
+
+def _expansion_key(query: str, model: str) -> Tuple[str, str, str]:
+    return (model, normalize_query(query), date.today().isoformat())
+
+
+def _expand_prompt(query: str) -> str:
+    now = datetime.now()
+    return EXPAND_PROMPT.format(
+        now=now.strftime("%Y-%m-%d %H:%M"),
+        weekday=now.strftime("%A"),
+        query=query,
+    )
+
+
+def _parse_expansion(raw: str) -> Expansion:
+    # Strip markdown code fences if model wraps response
+    text = raw.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    data = json.loads(text)
+    keywords = [str(k).lower() for k in (data.get("keywords") or []) if k]
+
+    date_range = None
+    df = data.get("date_from")
+    dt = data.get("date_to")
+    if df and df != "null":
+        try:
+            start = date.fromisoformat(str(df))
+            end = date.fromisoformat(str(dt)) if dt and dt != "null" else start
+            date_range = (start, end)
+        except ValueError:
+            pass
+
+    time_range = None
+    tf = data.get("time_from")
+    tt = data.get("time_to")
+    if (tf and tf != "null") or (tt and tt != "null"):
+        try:
+            t_start = time.fromisoformat(str(tf)) if tf and tf != "null" else None
+            t_end   = time.fromisoformat(str(tt)) if tt and tt != "null" else None
+            time_range = (t_start, t_end)
+        except ValueError:
+            pass
+
+    return keywords, date_range, time_range
+
+
+# Queries the built-in resolver found nothing in are only handed to dateparser
+# if they contain something date-like: a digit, a month name, or "ago".
+_DATEISH = re.compile(r"\d|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b|\bago\b")
+
+
+def extract_when(
+    query: str,
+) -> Tuple[Optional[Tuple[date, date]], Optional[Tuple[Optional[time], Optional[time]]]]:
+    """Date and time ranges named in the query (see timephrases.py).
+
+    dateparser is only a fallback for dates the resolver can't place, and is
+    skipped when the query named a time, which it would read as today."""
+    date_range, time_range = resolve_when(query)
+    if date_range is None and time_range is None and _DATEISH.search(query.lower()):
+        date_range = _dateparser_range(query)
+    return date_range, time_range
 
 
 def extract_date_range(query: str) -> Optional[Tuple[date, date]]:
     """Parse a date range from natural language in the query."""
-    import dateparser.search
+    return extract_when(query)[0]
+
 
-    q = query.lower()
-    today = date.today()
-
-    if "tonight" in q:
-        return (today, today)
-    if "tomorrow" in q:
-        d = today + timedelta(days=1)
-        return (d, d)
-    if "this weekend" in q or "weekend" in q:
-        days_to_sat = (5 - today.weekday()) % 7 or 7
-        sat = today + timedelta(days=days_to_sat)
-        return (sat, sat + timedelta(days=1))
-    if "next week" in q:
-        mon = today + timedelta(days=(7 - today.weekday()))
-        return (mon, mon + timedelta(days=6))
+def _dateparser_range(query: str) -> Optional[Tuple[date, date]]:
+    import dateparser.search
 
     try:
         results = dateparser.search.search_dates(query, languages=["en"])
@@ -171,7 +340,6 @@ def extract_date_range(query: str) -> Optional[Tuple[date, date]]:
             return (found, found)
     except Exception:
         pass
-
     return None
 
 
@@ -223,13 +391,24 @@ def filter_by_time(
     return out
 
 
+def field_text(event: Dict[str, Any], field: str) -> Optional[str]:
+    """Lowercased searchable text for one field, or None if the field is empty."""
+    value = event.get(field)
+    if not value:
+        return None
+    return " ".join(value).lower() if isinstance(value, list) else str(value).lower()
+
+
 def score_event(event: Dict[str, Any], terms: List[str]) -> int:
+    """Sum of field weights over every (field, term) substring hit.
+
+    The reference scorer: TermIndex and MatrixIndex reproduce it exactly.
+    """
     score = 0
     for field, weight in FIELD_WEIGHTS.items():
-        value = event.get(field)
-        if not value:
+        text = field_text(event, field)
+        if text is None:
             continue
-        text = " ".join(value).lower() if isinstance(value, list) else str(value).lower()
         for term in terms:
             if term in text:
                 score += weight
@@ -262,6 +441,12 @@ def main() -> int:
         action="store_true",
         help="Skip Gemini expansion, use raw keywords only",
     )
+    parser.add_argument(
+        "--ranking",
+        choices=RANKINGS,
+        default="weighted",
+        help="weighted field hits (default) or BM25F",
+    )
     parser.add_argument("--json", action="store_true", dest="as_json")
     args = parser.parse_args()
 
@@ -270,6 +455,7 @@ def main() -> int:
 
     llm_date_range = None
     llm_time_range = None
+    llm_used = False
     if not args.no_llm:
         print(f"Expanding with Gemini ({args.model}) …", file=sys.stderr)
         llm_keywords, llm_date_range, llm_time_range = expand_with_gemini(query, args.model)
@@ -285,6 +471,7 @@ def main() -> int:
                 if kw not in seen:
                     terms.append(kw)
                     seen.add(kw)
+            llm_used = True
         else:
             print("  Gemini unavailable — falling back to raw keywords.", file=sys.stderr)
 
@@ -292,19 +479,35 @@ def main() -> int:
         print("No search terms found in query.", file=sys.stderr)
         return 1
 
+    from index import Snapshot
+
+    # The same snapshot /search builds, so a query expands and scores alike in both.
+    snap = Snapshot.build(load_events(args.events), generation=0, expansions=LOCAL_EXPANSION and not llm_used)
+    if not llm_used:
+        local_added = snap.local_expansion(terms)
+        if local_added:
+            print(f"  Local terms  : {local_added}", file=sys.stderr)
+            terms = terms + local_added
+
     print(f"Terms          : {terms}", file=sys.stderr)
 
-    events = load_events(args.events)
-    date_range = llm_date_range or extract_date_range(query)
-    time_range = llm_time_range
-    if date_range:
-        print(f"Date filter    : {date_range[0]} → {date_range[1]}", file=sys.stderr)
+    date_range, time_range = llm_date_range, llm_time_range
+    if date_range is None or time_range is None:
+        local_dates, local_times = extract_when(query)
+        date_range = date_range or local_dates
+        time_range = time_range or local_times
+    ids = None
+    if date_range or time_range:
+        if date_range:
+            print(f"Date filter    : {date_range[0]} → {date_range[1]}", file=sys.stderr)
         if time_range:
             print(f"Time filter    : {time_range[0]} → {time_range[1]}", file=sys.stderr)
-        events = filter_by_date(events, date_range, time_range)
-        print(f"Events in range: {len(events)}", file=sys.stderr)
+        # Filter by id rather than slicing the list, so BM25F statistics come
+        # from the whole snapshot as they do in the API.
+        ids = snap.dates.filter(date_range, time_range)
+        print(f"Events in range: {len(ids)}", file=sys.stderr)
 
-    results = search(events, terms, args.top)
+    results = snap.terms.search(terms, args.top, ids, ranking=args.ranking)
 
     if not results:
         print("No matching events found.", file=sys.stderr)
@@ -312,7 +515,7 @@ def main() -> int:
 
     if args.as_json:
         print(json.dumps(
-            [{"score": s, "url": e["url"], "title": e["title"], "start": e.get("start")}
+            [{"score": round(s, 4), "url": e["url"], "title": e["title"], "start": e.get("start")}
              for s, e in results],
             indent=2, ensure_ascii=False,
         ))
@@ -320,7 +523,8 @@ def main() -> int:
         print(f"\nTop {len(results)} results:", file=sys.stderr)
         for score, event in results:
             start = (event.get("start") or "")[:16].replace("T", " ")
-            print(f"  [{score:3d}]  {event['url']}")
+            shown = f"{score:3d}" if isinstance(score, int) else f"{score:5.2f}"
+            print(f"  [{shown}]  {event['url']}")
             print(f"         {event['title']}  —  {start}")
 
     return 0
@@ -0,0 +1,188 @@
+"""Local semantic retrieval: hashed TF-IDF + LSA event vectors, ranked by cosine similarity."""
+
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # /search?mode=semantic is unavailable
+    np = None
+
+from search import STOP_WORDS
+
+HASH_BITS = 20
+LSA_DIMS = 128
+LSA_POWER_ITERATIONS = 1
+# Final score = LSA_WEIGHT × LSA cosine + (1 - LSA_WEIGHT) × TF-IDF cosine:
+# LSA finds related events without shared words, TF-IDF keeps exact
+# matches on top.
+LSA_WEIGHT = 0.5
+MIN_SIMILARITY = 0.05
+TITLE_BOOST = 2
+# Rows per block in the sparse × dense products, bounding their scratch memory.
+_BLOCK_ROWS = 4096
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def available() -> bool:
+    return np is not None
+
+
+def tokens(text: str) -> List[str]:
+    return [w for w in _WORD.findall(text.lower()) if w not in STOP_WORDS and len(w) > 1]
+
+
+@lru_cache(maxsize=1 << 16)
+def _feature(token: str) -> int:
+    # crc32 rather than hash(): stable across processes and PYTHONHASHSEED.
+    return zlib.crc32(token.encode("utf-8")) & ((1 << HASH_BITS) - 1)
+
+
+def event_features(event: Dict[str, Any]) -> Counter:
+    """Hashed token counts over title (boosted), group and description."""
+    counts: Counter = Counter()
+    for field, boost in (("title", TITLE_BOOST), ("group", 1), ("description", 1)):
+        for token in tokens(event.get(field) or ""):
+            counts[_feature(token)] += boost
+    return counts
+
+
+class _Sparse:
+    """Minimal CSR matrix: enough for X @ dense, by row blocks."""
+
+    def __init__(self, rows: "np.ndarray", cols: "np.ndarray", vals: "np.ndarray", shape: Tuple[int, int]):
+        order = np.argsort(rows, kind="stable")
+        self.indices, self.data = cols[order], vals[order]
+        self.indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        self.indptr[1:] = np.cumsum(np.bincount(rows, minlength=shape[0]))
+        self.shape = shape
+
+    def dot(self, dense: "np.ndarray") -> "np.ndarray":
+        out = np.zeros((self.shape[0], dense.shape[1]), dtype=dense.dtype)
+        for lo in range(0, self.shape[0], _BLOCK_ROWS):
+            hi = min(lo + _BLOCK_ROWS, self.shape[0])
+            starts = self.indptr[lo:hi]
+            rows = np.flatnonzero(self.indptr[lo + 1:hi + 1] > starts)
+            if not len(rows):
+                continue
+            a, b = self.indptr[lo], self.indptr[hi]
+            products = self.data[a:b, None] * dense[self.indices[a:b]]
+            # reduceat over the non-empty rows only; an empty row would
+            # otherwise pick up its neighbour's first product.
+            out[lo + rows] = np.add.reduceat(products, starts[rows] - a, axis=0)
+        return out
+
+
+class SemanticIndex:
+    """Unit-length LSA vectors for every event, plus the TF-IDF matrix behind them.
+
+    Events are hashed bags of words (sublinear tf × smoothed idf, L2
+    normalized). A truncated SVD of that matrix, computed with a seeded
+    randomized range finder, maps events and queries into LSA_DIMS
+    dimensions where words that co-occur across events end up close, so a
+    query can match events that share none of its words. Queries are folded
+    in through the same components; no network or model files are needed.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        if np is None:
+            raise RuntimeError("semantic search needs numpy")
+        self.events = events
+        n = len(events)
+        rows: List[int] = []
+        feats: List[int] = []
+        counts: List[int] = []
+        for doc_id, event in enumerate(events):
+            for feature, count in event_features(event).items():
+                rows.append(doc_id)
+                feats.append(feature)
+                counts.append(count)
+
+        self.features, cols = np.unique(np.array(feats, dtype=np.int64), return_inverse=True)
+        cols = cols.astype(np.int64)
+        rows_arr = np.array(rows, dtype=np.int64)
+        dim = len(self.features)
+        df = np.bincount(cols, minlength=dim)
+        self.idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+        vals = (1 + np.log(np.array(counts, dtype=np.float32))) * self.idf[cols]
+        norms = np.sqrt(np.bincount(rows_arr, weights=vals * vals, minlength=n))
+        vals = (vals / np.maximum(norms, 1e-12)[rows_arr]).astype(np.float32)
+
+        self._tfidf = _Sparse(rows_arr, cols, vals, (n, dim))
+        self._tfidf_t = _Sparse(cols, rows_arr, vals, (dim, n))
+        self.components, self.vectors = self._lsa(min(LSA_DIMS, n - 1, dim - 1))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def _lsa(self, k: int) -> Tuple[Optional["np.ndarray"], Optional["np.ndarray"]]:
+        """(k × features components, n × k unit event vectors) via randomized SVD."""
+        if k < 2:
+            return None, None
+        rng = np.random.default_rng(0)
+        x, xt = self._tfidf, self._tfidf_t
+        q, _ = np.linalg.qr(x.dot(rng.standard_normal((x.shape[1], k + 10)).astype(np.float32)))
+        for _ in range(LSA_POWER_ITERATIONS):
+            q, _ = np.linalg.qr(xt.dot(q))
+            q, _ = np.linalg.qr(x.dot(q))
+        u, s, vt = np.linalg.svd(xt.dot(q).T, full_matrices=False)
+        vectors = (q @ u[:, :k]) * s[:k]
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vt[:k].astype(np.float32), vectors.astype(np.float32)
+
+    def _query(self, terms: List[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Known feature columns of the query and their unit TF-IDF weights."""
+        if not len(self.features):
+            # An empty snapshot (cold start) has no vocabulary to match.
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        counts = Counter(_feature(t) for term in terms for t in tokens(term))
+        hashes = np.fromiter(counts, dtype=np.int64, count=len(counts))
+        pos = np.searchsorted(self.features, hashes)
+        known = (pos < len(self.features)) & (self.features[np.minimum(pos, len(self.features) - 1)] == hashes)
+        cols = pos[known]
+        tf = np.array([counts[h] for h in hashes[known].tolist()], dtype=np.float32)
+        weights = (1 + np.log(tf)) * self.idf[cols]
+        return cols, weights / max(float(np.linalg.norm(weights)), 1e-12)
+
+    def similarities(self, terms: List[str], ids: Optional[Iterable[int]] = None) -> "np.ndarray":
+        """Blended cosine similarity of every event to the query, 0 outside ``ids``."""
+        n = len(self.events)
+        score = np.zeros(n, dtype=np.float32)
+        cols, weights = self._query(terms)
+        if not len(cols):
+            return score
+        xt = self._tfidf_t
+        for col, weight in zip(cols.tolist(), weights.tolist()):
+            a, b = xt.indptr[col], xt.indptr[col + 1]
+            score[xt.indices[a:b]] += (1 - LSA_WEIGHT) * weight * xt.data[a:b]
+        if self.vectors is not None:
+            folded = self.components[:, cols] @ weights
+            norm = float(np.linalg.norm(folded))
+            if norm > 0:
+                score += LSA_WEIGHT * (self.vectors @ (folded / norm))
+        if ids is not None:
+            mask = np.zeros(n, dtype=bool)
+            mask[np.fromiter(ids, dtype=np.int64)] = True
+            score[~mask] = 0
+        return score
+
+    def search(
+        self,
+        terms: List[str],
+        top_n: int,
+        ids: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Top events by similarity, ties in snapshot order; below MIN_SIMILARITY is dropped."""
+        score = self.similarities(terms, ids)
+        hits = np.flatnonzero(score >= MIN_SIMILARITY)
+        if top_n <= 0 or not len(hits):
+            return []
+        if len(hits) > top_n:
+            kth = score[hits][np.argpartition(-score[hits], top_n - 1)[top_n - 1]]
+            hits = hits[score[hits] >= kth]
+        order = hits[np.lexsort((hits, -score[hits]))][:top_n]
+        return [(float(score[d]), self.events[d]) for d in order.tolist()]
@@ -0,0 +1,254 @@
+"""Resolve the date and time phrases EXPAND_PROMPT describes, without dateparser or an LLM.
+
+Dates follow the prompt's rules: "this week" runs through Sunday, "next
+week" is the following Monday to Sunday, weekends are Saturday and Sunday,
+months are full months (from today for "this month"), and "soon" is the
+next 7 days. Explicit dates ("2026-04-01", "4/1", "april 1st", "1 apr")
+without a year that have already passed this year roll over to next year.
+Bare weekdays mean the nearest one, today included; "next friday" is the
+Friday of next week.
+
+Times are (start, end) bounds, either of which may be open: morning 06-12,
+afternoon 12-17, evening/tonight 17-21, night 21-, "after 6pm", "before
+noon", "between 2 and 4pm", "2-4pm", "10am to noon", and "at 3pm" as a
+one-hour window. A bare number is only a time with am/pm, o'clock or
+minutes ("at 7:30"), or as the first bound of a range; "from 3 speakers"
+and "ages 2-4" have no time. An hour of 1-7 without am/pm is read as pm,
+since few events start before 8am.
+"""
+
+import calendar
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Tuple
+
+DateRange = Tuple[date, date]
+TimeRange = Tuple[Optional[time], Optional[time]]
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+          "august", "september", "october", "november", "december")
+_MONTH = {m: i + 1 for i, m in enumerate(MONTHS)}
+_MONTH.update({m[:3]: i + 1 for i, m in enumerate(MONTHS)})
+_MONTH["sept"] = 9
+_NUMBERS = {w: i + 1 for i, w in enumerate(
+    ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", "eleven", "twelve"))}
+
+_MONTH_NAME = r"(?P<month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+_DAY = r"(?P<day>[0-3]?\d)(?:st|nd|rd|th)?"
+_YEAR = r"(?:,?\s+(?P<year>\d{4}))?"
+
+_ISO_DATE = re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\b")
+_SLASH_DATE = re.compile(r"\b(?P<month>1[0-2]|0?[1-9])/(?P<day>[0-3]?\d)(?:/(?P<year>\d{4}|\d{2}))?\b")
+_MONTH_DAY = re.compile(rf"\b{_MONTH_NAME}\.?\s+{_DAY}\b{_YEAR}")
+_DAY_MONTH = re.compile(rf"\b{_DAY}\s+(?:of\s+)?{_MONTH_NAME}\b{_YEAR}")
+_WEEKDAY = re.compile(r"\b(?P<next>next\s+)?(?:this\s+|on\s+)?(?P<weekday>monday|tuesday|wednesday|thursday|friday|saturday|sunday)s?\b")
+# "may" and "march" are also ordinary words, so they need a lead-in.
+_MONTH_ONLY = re.compile(
+    r"\b(?:(?P<lead>in|during|this|next|for|of|through)\s+)?"
+    r"(?P<month>january|february|march|april|may|june|july|august|september|october|november|december)\b"
+)
+_FROM_NOW = re.compile(
+    r"\b(?:in\s+|next\s+)?(?P<n>\d+|a|an|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)\s+"
+    r"(?P<unit>day|week|month)s?(?:\s+from\s+now)?\b"
+)
+
+_HOUR_WORDS = "|".join(_NUMBERS)
+
+
+def _clock_pattern(p: str, bare_hour: bool = False, suffix_required: bool = False) -> str:
+    """A clock time whose groups are prefixed with ``p``.
+
+    A number needs am/pm, o'clock or ":MM" to count as a time ("from 3
+    speakers", "by 4-h club" are not), unless ``bare_hour``; spelled-out
+    hours ("six") always need am/pm or o'clock, so "at one point" is not a
+    time. ``suffix_required`` demands am/pm or o'clock even after ":MM".
+    """
+    suffix = rf"(?P<{p}ap>[ap]\.?m\b\.?|o'?clock)"
+    marked = r"(?=\s*(?:[ap]\.?m\b|o'?clock))"
+    hour_marked = "" if bare_hour or suffix_required else rf"(?=:\d{{2}}|\s*(?:[ap]\.?m\b|o'?clock))"
+    return (
+        rf"(?:(?P<{p}h>\d{{1,2}})(?!\d){hour_marked}(?::(?P<{p}m>\d{{2}}))?"
+        rf"|(?P<{p}w>{_HOUR_WORDS}){marked}|(?P<{p}n>noon|midnight))"
+        rf"\s*{suffix}{'' if suffix_required else '?'}"
+    )
+
+
+# Only the first bound of a range may be a bare hour: the second supplies its
+# am/pm ("between 2 and 4pm"). Without "between"/"from" only "-" and "to"
+# join the bounds ("2-4pm", "10am to noon").
+_BETWEEN = re.compile(
+    rf"\b(?:(?P<lead>between|from)\s+)?{_clock_pattern('a', bare_hour=True)}"
+    rf"\s*(?(lead)(?:and|to|-|–|until|till)|(?:to\b|-|–))\s*{_clock_pattern('b')}"
+)
+_AFTER = re.compile(rf"\b(?:after|from|starting(?:\s+at)?|past)\s+{_clock_pattern('a')}")
+_BEFORE = re.compile(rf"\b(?:before|until|till|by)\s+{_clock_pattern('a')}")
+_AT = re.compile(rf"\b(?:at|around)\s+{_clock_pattern('a')}")
+_BARE = re.compile(rf"\b{_clock_pattern('a', suffix_required=True)}")
+# Text around a clock that makes it one end of a range _BETWEEN couldn't read.
+_RANGE_BEFORE = re.compile(
+    rf"(?:\d|\b(?:{_HOUR_WORDS}|noon|midnight)|[ap]\.?m\.?|o'?clock)\s*(?:-|–|\bto|\buntil|\btill)\s*$"
+)
+_RANGE_AFTER = re.compile(r"\s*(?:-|–|to\b|until\b|till\b)\s*(?:\d|noon\b|midnight\b)")
+_RELATIVE_DATE = re.compile(
+    r"\b(?:today|tonight|tomorrow|(?:next\s+)?weekend|(?:this|next)\s+(?:week|month)|soon|upcoming)\b"
+)
+
+_PERIODS = (
+    (re.compile(r"\bnight\b"), (time(21, 0), None)),
+    (re.compile(r"\bevening\b|\btonight\b"), (time(17, 0), time(21, 0))),
+    (re.compile(r"\bafternoon\b"), (time(12, 0), time(17, 0))),
+    (re.compile(r"\bmorning\b"), (time(6, 0), time(12, 0))),
+)
+
+
+def strip(query: str) -> str:
+    """``query`` lowercased, with every date and clock phrase resolve() reads blanked out,
+    so they don't also become search terms."""
+    q = query.lower()
+    for pattern in (_ISO_DATE, _SLASH_DATE, _MONTH_DAY, _DAY_MONTH, _WEEKDAY, _RELATIVE_DATE,
+                    _BETWEEN, _AFTER, _BEFORE, _AT, _BARE, *(p for p, _ in _PERIODS)):
+        q = pattern.sub(" ", q)
+    q = _MONTH_ONLY.sub(lambda m: m.group(0) if m.group("month") in ("may", "march") and not m.group("lead") else " ", q)
+    return _FROM_NOW.sub(
+        lambda m: " " if m.group(0).startswith(("in ", "next ")) or "from now" in m.group(0) else m.group(0), q
+    )
+
+
+def resolve(query: str, now: Optional[datetime] = None) -> Tuple[Optional[DateRange], Optional[TimeRange]]:
+    """(date range, time range) named in ``query``; either is None if absent."""
+    q = query.lower()
+    today = (now or datetime.now()).date()
+    return resolve_date(q, today), resolve_time(q)
+
+
+def resolve_date(q: str, today: date) -> Optional[DateRange]:
+    found = _explicit_date(q, today)
+    if found is not None:
+        return found, found
+    if "tomorrow" in q:
+        d = today + timedelta(days=1)
+        return d, d
+    if re.search(r"\b(?:today|tonight)\b", q):
+        return today, today
+
+    saturday = today + timedelta(days=(5 - today.weekday()) % 7)
+    if today.weekday() == 6:
+        saturday = today - timedelta(days=1)
+    if re.search(r"\bnext\s+weekend\b", q):
+        return saturday + timedelta(days=7), saturday + timedelta(days=8)
+    if re.search(r"\bweekend\b", q):
+        return max(saturday, today), saturday + timedelta(days=1)
+
+    m = _WEEKDAY.search(q)
+    if m:
+        target = WEEKDAYS.index(m.group("weekday"))
+        if m.group("next"):
+            d = today + timedelta(days=7 - today.weekday() + target)
+        else:
+            d = today + timedelta(days=(target - today.weekday()) % 7)
+        return d, d
+
+    monday = today - timedelta(days=today.weekday())
+    if re.search(r"\bnext\s+week\b", q):
+        return monday + timedelta(days=7), monday + timedelta(days=13)
+    if re.search(r"\bthis\s+week\b", q):
+        return today, monday + timedelta(days=6)
+    if re.search(r"\bnext\s+month\b", q):
+        first = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
+        return first, _month_end(first.year, first.month)
+    if re.search(r"\bthis\s+month\b", q):
+        return today, _month_end(today.year, today.month)
+
+    for m in _MONTH_ONLY.finditer(q):
+        month = _MONTH[m.group("month")]
+        if m.group("month") in ("may", "march") and not m.group("lead"):
+            continue
+        year = today.year if month >= today.month else today.year + 1
+        return date(year, month, 1), _month_end(year, month)
+
+    m = _FROM_NOW.search(q)
+    if m and (m.group(0).startswith(("in ", "next ")) or "from now" in m.group(0)):
+        n = m.group("n")
+        count = int(n) if n.isdigit() else _NUMBERS.get(n, 1)
+        days = {"day": 1, "week": 7, "month": 30}[m.group("unit")] * count
+        return today, today + timedelta(days=days)
+    if re.search(r"\b(?:soon|upcoming)\b", q):
+        return today, today + timedelta(days=7)
+    return None
+
+
+def resolve_time(q: str) -> Optional[TimeRange]:
+    m = _BETWEEN.search(q)
+    if m:
+        start, end = _clock(m, "a", default_pm=False), _clock(m, "b")
+        if start is not None and end is not None:
+            # "between 2 and 4pm": a bare first bound shares the second's pm.
+            if not m.group("aap") and not m.group("an") and start.hour + 12 <= end.hour:
+                start = start.replace(hour=start.hour + 12)
+            return start, end
+    m = _AFTER.search(q)
+    if m and _clock(m, "a") is not None:
+        return _clock(m, "a"), None
+    m = _BEFORE.search(q)
+    if m and _clock(m, "a") is not None:
+        return None, _clock(m, "a")
+    m = _single_clock(q)
+    if m and _clock(m, "a") is not None:
+        start = _clock(m, "a")
+        return start, (datetime.combine(date.min, start) + timedelta(hours=1)).time() if start.hour < 23 else None
+    for pattern, bounds in _PERIODS:
+        if pattern.search(q):
+            return bounds
+    return None
+
+
+def _single_clock(q: str) -> Optional["re.Match"]:
+    """The first "at 3pm" or bare "3pm" that isn't one end of a range, so
+    "two-4pm" gets no one-hour window at 4pm."""
+    for pattern in (_AT, _BARE):
+        for m in pattern.finditer(q):
+            if not _RANGE_AFTER.match(q, m.end()) and not _RANGE_BEFORE.search(q, 0, m.start()):
+                return m
+    return None
+
+
+def _clock(m: "re.Match", p: str, default_pm: Optional[bool] = None) -> Optional[time]:
+    named = m.group(p + "n")
+    if named:
+        return time(12, 0) if named == "noon" else time(0, 0)
+    word = m.group(p + "w")
+    hour = _NUMBERS[word] if word else int(m.group(p + "h"))
+    minute = int(m.group(p + "m") or 0) if not word else 0
+    suffix = (m.group(p + "ap") or "").replace(".", "")
+    if suffix in ("am", "pm"):
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if suffix == "pm" else 0)
+    elif hour < 12 and (default_pm if default_pm is not None else 1 <= hour <= 7):
+        hour += 12
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _explicit_date(q: str, today: date) -> Optional[date]:
+    for pattern in (_ISO_DATE, _SLASH_DATE, _MONTH_DAY, _DAY_MONTH):
+        m = pattern.search(q)
+        if not m:
+            continue
+        month = m.group("month")
+        month = int(month) if month.isdigit() else _MONTH[month[:4] if month.startswith("sept") else month[:3]]
+        year = m.group("year")
+        try:
+            if year:
+                return date(int(year) + (2000 if len(year) == 2 else 0), month, int(m.group("day")))
+            d = date(today.year, month, int(m.group("day")))
+            return d if d >= today else d.replace(year=today.year + 1)
+        except ValueError:
+            continue
+    return None
+
+
+def _month_end(year: int, month: int) -> date:
+    return date(year, month, calendar.monthrange(year, month)[1])